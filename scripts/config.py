@@ -72,7 +72,14 @@ class PostmanConfig:
         self.workspace_id = os.getenv("POSTMAN_WORKSPACE_ID")
         self.rate_limit_delay = int(os.getenv("POSTMAN_RATE_LIMIT_DELAY", "60"))
         self.max_retries = int(os.getenv("POSTMAN_MAX_RETRIES", "3"))
+        # Retry backoff: base * 2**attempt seconds, capped, with jitter
+        self.retry_base_delay = float(os.getenv("POSTMAN_RETRY_BASE_DELAY", "0.25"))
+        self.retry_max_delay = float(os.getenv("POSTMAN_RETRY_MAX_DELAY", "8"))
         self.timeout = int(os.getenv("POSTMAN_TIMEOUT", "10"))
+        # Seconds to reuse GET responses within a run (0 disables the cache)
+        self.cache_ttl = int(os.getenv("POSTMAN_CACHE_TTL", "30"))
+        # Upper bound on parallel requests issued by bulk helpers
+        self.max_concurrency = int(os.getenv("POSTMAN_MAX_CONCURRENCY", "8"))
 
         # Proxy settings
         # By default, bypass all proxies to avoid "403 Forbidden" proxy errors
@@ -89,6 +96,10 @@ class PostmanConfig:
             # Use system/environment proxy settings
             self.proxies = None
 
+        # Use pycurl for requests when it is installed (POSTMAN_USE_PYCURL=false
+        # forces the curl binary)
+        self.use_pycurl = os.getenv("POSTMAN_USE_PYCURL", "true").lower() in ("true", "1", "yes")
+
         # Logging
         self.log_level = os.getenv("LOG_LEVEL", "INFO")
 
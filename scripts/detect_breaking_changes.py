@@ -420,12 +420,12 @@ Examples:
             client = PostmanClient()
             print(f"=== Comparing API Versions ===\n")
 
-            # Get old version schema
-            old_schemas = client.get_api_schema(args.api, args.old_version)
+            # Get old and new version schemas in parallel
+            old_schemas, new_schemas = client.gather(
+                lambda: client.get_api_schema(args.api, args.old_version),
+                lambda: client.get_api_schema(args.api, args.new_version)
+            )
             old_spec = json.loads(old_schemas[0].get('schema', '{}'))
-
-            # Get new version schema
-            new_schemas = client.get_api_schema(args.api, args.new_version)
             new_spec = json.loads(new_schemas[0].get('schema', '{}'))
 
             detector.compare_openapi_specs(old_spec, new_spec)
@@ -450,8 +450,7 @@ Examples:
             client = PostmanClient()
             print(f"=== Comparing Collections ===\n")
 
-            old_col = client.get_collection(args.collection[0])
-            new_col = client.get_collection(args.collection[1])
+            old_col, new_col = client.get_collections_bulk(args.collection)
 
             detector.compare_collections(old_col, new_col)
 
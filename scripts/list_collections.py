@@ -76,10 +76,12 @@ def main():
         if args.all:
             # List everything for workspace summary
             print("Fetching workspace resources...")
-            collections = client.list_collections()
-            environments = client.list_environments()
-            monitors = client.list_monitors()
-            apis = client.list_apis()
+            collections, environments, monitors, apis = client.gather(
+                client.list_collections,
+                client.list_environments,
+                client.list_monitors,
+                client.list_apis
+            )
 
             print(format_workspace_summary(collections, environments, monitors, apis))
 
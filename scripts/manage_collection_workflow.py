@@ -125,8 +125,7 @@ def compare_collections(client, id1, id2):
     print(f"=== Comparing Collections ===\n")
 
     try:
-        col1 = client.get_collection(id1)
-        col2 = client.get_collection(id2)
+        col1, col2 = client.get_collections_bulk([id1, id2])
 
         name1 = col1.get('info', {}).get('name', 'Collection 1')
         name2 = col2.get('info', {}).get('name', 'Collection 2')
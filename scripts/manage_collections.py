@@ -13,6 +13,40 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.config import PostmanConfig
 from scripts.postman_client import PostmanClient
+from utils.exceptions import PostmanAPIError
+
+
+_COLLECTION_SCHEMA = "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"
+
+# Shared immutable placeholder for missing list fields (serializes as [])
+_EMPTY = ()
+
+_EPILOG = """
+Examples:
+  # List all collections
+  python manage_collections.py --list
+
+  # Get collection details
+  python manage_collections.py --get <collection-id>
+
+  # Create a new collection
+  python manage_collections.py --create --name "My API Tests" --description "API test collection"
+
+  # Create a collection with a request
+  python manage_collections.py --create --name "My API" --add-request '{"name": "Get Users", "method": "GET", "url": "https://api.example.com/users"}'
+
+  # Update a collection name
+  python manage_collections.py --update <collection-id> --name "New Name"
+
+  # Delete a collection
+  python manage_collections.py --delete <collection-id>
+
+  # Duplicate a collection
+  python manage_collections.py --duplicate <collection-id> --name "Copy of Collection"
+
+  # Duplicate a collection server-side as a fork (no local download)
+  python manage_collections.py --duplicate <collection-id> --name "my-feature-branch" --fork
+"""
 
 
 def create_minimal_collection(name, description=""):
@@ -30,7 +64,7 @@ def create_minimal_collection(name, description=""):
         "info": {
             "name": name,
             "description": description,
-            "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"
+            "schema": _COLLECTION_SCHEMA
         },
         "item": []
     }
@@ -72,29 +106,7 @@ def main():
     parser = argparse.ArgumentParser(
         description='Manage Postman collections',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List all collections
-  python manage_collections.py --list
-
-  # Get collection details
-  python manage_collections.py --get <collection-id>
-
-  # Create a new collection
-  python manage_collections.py --create --name "My API Tests" --description "API test collection"
-
-  # Create a collection with a request
-  python manage_collections.py --create --name "My API" --add-request '{"name": "Get Users", "method": "GET", "url": "https://api.example.com/users"}'
-
-  # Update a collection name
-  python manage_collections.py --update <collection-id> --name "New Name"
-
-  # Delete a collection
-  python manage_collections.py --delete <collection-id>
-
-  # Duplicate a collection
-  python manage_collections.py --duplicate <collection-id> --name "Copy of Collection"
-        """
+        epilog=_EPILOG
     )
 
     # Action arguments
@@ -114,6 +126,11 @@ Examples:
     # Collection data arguments
     parser.add_argument('--name', help='Collection name')
     parser.add_argument('--description', help='Collection description', default='')
+    parser.add_argument('--fork', action='store_true',
+                        help='With --duplicate: fork the collection server-side (uses --name as the fork label), '
+                             'falling back to a full copy if the fork is rejected')
+    parser.add_argument('--confirm-name', action='store_true',
+                        help='With --delete: look up and show the collection name before deleting')
     parser.add_argument('--add-request', metavar='REQUEST_JSON',
                         help='Add a request to the collection (JSON format: {"name": "...", "method": "...", "url": "..."})')
     parser.add_argument('--workspace', metavar='WORKSPACE_ID',
@@ -240,12 +257,14 @@ Examples:
         elif args.delete:
             print(f"Deleting collection {args.delete}...")
 
-            # Get collection name first
-            try:
-                collection = client.get_collection(args.delete)
-                name = collection.get('info', {}).get('name', args.delete)
-            except:
-                name = args.delete
+            # Only spend a round trip on the name lookup when asked to
+            name = args.delete
+            if args.confirm_name:
+                try:
+                    collection = client.get_collection(args.delete)
+                    name = collection.get('info', {}).get('name', args.delete)
+                except PostmanAPIError:
+                    pass
 
             client.delete_collection(args.delete)
             print(f"\nCollection '{name}' deleted successfully!")
@@ -254,26 +273,43 @@ Examples:
             if not args.name:
                 parser.error("--name is required when duplicating a collection")
 
+            if args.fork:
+                print(f"Forking collection {args.duplicate} server-side...")
+                try:
+                    result = client.fork_collection(args.duplicate, label=args.name,
+                                                    workspace_id=args.workspace)
+                except PostmanAPIError as e:
+                    # Only fall back when the fork endpoint rejects the request;
+                    # network and server errors would fail the copy path too.
+                    if not e.status_code or e.status_code >= 500:
+                        raise
+                    print(f"  Fork rejected ({e.status_code}), falling back to a full copy...")
+                else:
+                    print(f"\nCollection forked successfully!")
+                    print(f"Original: {args.duplicate}")
+                    print(f"Fork: {result.get('name', 'N/A')} ({result.get('uid', 'N/A')})")
+                    return 0
+
             print(f"Fetching collection to duplicate...")
             source_collection = client.get_collection(args.duplicate)
 
             # Create a new collection data based on the source
+            source_info = source_collection.get('info') or {}
             new_collection = {
                 "info": {
                     "name": args.name,
-                    "description": source_collection.get('info', {}).get('description', ''),
-                    "schema": source_collection.get('info', {}).get('schema',
-                                                                    'https://schema.getpostman.com/json/collection/v2.1.0/collection.json')
+                    "description": source_info.get('description') or '',
+                    "schema": source_info.get('schema') or _COLLECTION_SCHEMA
                 },
-                "item": source_collection.get('item', []),
-                "variable": source_collection.get('variable', [])
+                "item": source_collection.get('item') or _EMPTY,
+                "variable": source_collection.get('variable') or _EMPTY
             }
 
             print(f"Creating duplicate collection '{args.name}'...")
             result = client.create_collection(new_collection, workspace_id=args.workspace)
 
             print(f"\nCollection duplicated successfully!")
-            print(f"Original: {source_collection.get('info', {}).get('name', 'N/A')} ({args.duplicate})")
+            print(f"Original: {source_info.get('name', 'N/A')} ({args.duplicate})")
             print(f"Duplicate: {result.get('name', 'N/A')} ({result.get('uid', 'N/A')})")
 
         return 0
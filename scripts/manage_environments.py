@@ -13,6 +13,38 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.config import PostmanConfig
 from scripts.postman_client import PostmanClient
+from utils.exceptions import PostmanAPIError
+
+
+# Shared immutable placeholder for missing list fields (serializes as [])
+_EMPTY = ()
+
+_EPILOG = """
+Examples:
+  # List all environments
+  python manage_environments.py --list
+
+  # Get environment details
+  python manage_environments.py --get <environment-id>
+
+  # Create a new environment
+  python manage_environments.py --create --name "Development"
+
+  # Create an environment with variables
+  python manage_environments.py --create --name "Dev" --add-var '{"key": "API_URL", "value": "https://dev.api.com"}'
+
+  # Add multiple variables (as JSON array)
+  python manage_environments.py --create --name "Staging" --variables '[{"key":"API_URL","value":"https://staging.api.com"},{"key":"API_KEY","value":"secret123","type":"secret"}]'
+
+  # Update an environment name
+  python manage_environments.py --update <environment-id> --name "New Name"
+
+  # Delete an environment
+  python manage_environments.py --delete <environment-id>
+
+  # Duplicate an environment
+  python manage_environments.py --duplicate <environment-id> --name "Copy of Environment"
+"""
 
 
 def create_minimal_environment(name, values=None):
@@ -61,32 +93,7 @@ def main():
     parser = argparse.ArgumentParser(
         description='Manage Postman environments',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List all environments
-  python manage_environments.py --list
-
-  # Get environment details
-  python manage_environments.py --get <environment-id>
-
-  # Create a new environment
-  python manage_environments.py --create --name "Development"
-
-  # Create an environment with variables
-  python manage_environments.py --create --name "Dev" --add-var '{"key": "API_URL", "value": "https://dev.api.com"}'
-
-  # Add multiple variables (as JSON array)
-  python manage_environments.py --create --name "Staging" --variables '[{"key":"API_URL","value":"https://staging.api.com"},{"key":"API_KEY","value":"secret123","type":"secret"}]'
-
-  # Update an environment name
-  python manage_environments.py --update <environment-id> --name "New Name"
-
-  # Delete an environment
-  python manage_environments.py --delete <environment-id>
-
-  # Duplicate an environment
-  python manage_environments.py --duplicate <environment-id> --name "Copy of Environment"
-        """
+        epilog=_EPILOG
     )
 
     # Action arguments
@@ -105,6 +112,8 @@ Examples:
 
     # Environment data arguments
     parser.add_argument('--name', help='Environment name')
+    parser.add_argument('--confirm-name', action='store_true',
+                        help='With --delete: look up and show the environment name before deleting')
     parser.add_argument('--add-var', metavar='VARIABLE_JSON',
                         help='Add a variable (JSON format: {"key": "...", "value": "...", "type": "default|secret"})')
     parser.add_argument('--variables', metavar='VARIABLES_JSON',
@@ -248,12 +257,14 @@ Examples:
         elif args.delete:
             print(f"Deleting environment {args.delete}...")
 
-            # Get environment name first
-            try:
-                environment = client.get_environment(args.delete)
-                name = environment.get('name', args.delete)
-            except:
-                name = args.delete
+            # Only spend a round trip on the name lookup when asked to
+            name = args.delete
+            if args.confirm_name:
+                try:
+                    environment = client.get_environment(args.delete)
+                    name = environment.get('name', args.delete)
+                except PostmanAPIError:
+                    pass
 
             client.delete_environment(args.delete)
             print(f"\nEnvironment '{name}' deleted successfully!")
@@ -268,7 +279,7 @@ Examples:
             # Create a new environment data based on the source
             new_environment = {
                 "name": args.name,
-                "values": source_environment.get('values', [])
+                "values": source_environment.get('values') or _EMPTY
             }
 
             print(f"Creating duplicate environment '{args.name}'...")
@@ -16,14 +16,38 @@ Usage:
 import sys
 import os
 import argparse
-import json
+from functools import partial
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from scripts.postman_client import PostmanClient
-from scripts.config import PostmanConfig
-from utils.formatters import format_table, format_json
+
+_EPILOG = """
+Examples:
+  # List all mock servers
+  python manage_mocks.py --list
+
+  # Get mock server details
+  python manage_mocks.py --get abc-123
+
+  # Create a mock server
+  python manage_mocks.py --create --name="Payment Mock" --collection=col-456
+
+  # Create a private mock with delay
+  python manage_mocks.py --create --name="Test Mock" --collection=col-456 --private --delay=1000
+
+  # Update mock server
+  python manage_mocks.py --update abc-123 --name="New Name" --private
+
+  # Delete mock server
+  python manage_mocks.py --delete abc-123
+
+  # Delete several mock servers (one confirmation)
+  python manage_mocks.py --delete abc-123,def-456
+
+  # Delete without the lookup and prompt (e.g. from CI)
+  python manage_mocks.py --delete abc-123 --yes
+"""
 
 
 def list_mocks(client):
@@ -37,17 +61,22 @@ def list_mocks(client):
             print("No mock servers found in workspace")
             return
 
-        print(f"Found {len(mocks)} mock server(s):\n")
+        # Collect the listing and write it in one go
+        output = []
+        output.append(f"Found {len(mocks)} mock server(s):\n")
 
         for i, mock in enumerate(mocks, 1):
-            print(f"{i}. {mock.get('name', 'Unnamed Mock')}")
-            print(f"   ID: {mock.get('id')}")
-            print(f"   Mock URL: {mock.get('mockUrl', 'N/A')}")
-            print(f"   Collection: {mock.get('collection', 'N/A')}")
-            if mock.get('environment'):
-                print(f"   Environment: {mock.get('environment')}")
-            print(f"   Private: {mock.get('private', False)}")
-            print()
+            environment = mock.get('environment')
+            output.append(f"{i}. {mock.get('name', 'Unnamed Mock')}")
+            output.append(f"   ID: {mock.get('id')}")
+            output.append(f"   Mock URL: {mock.get('mockUrl', 'N/A')}")
+            output.append(f"   Collection: {mock.get('collection', 'N/A')}")
+            if environment:
+                output.append(f"   Environment: {environment}")
+            output.append(f"   Private: {mock.get('private', False)}")
+            output.append("")
+
+        print("\n".join(output))
 
     except Exception as e:
         print(f"Error listing mock servers: {e}")
@@ -60,29 +89,33 @@ def get_mock(client, mock_id):
 
     try:
         mock = client.get_mock(mock_id)
+        mock_url = mock.get('mockUrl', 'N/A')
+        environment = mock.get('environment')
+        config = mock.get('config')
 
         print(f"Name: {mock.get('name', 'Unnamed Mock')}")
         print(f"ID: {mock.get('id')}")
-        print(f"Mock URL: {mock.get('mockUrl', 'N/A')}")
+        print(f"Mock URL: {mock_url}")
         print(f"Collection ID: {mock.get('collection', 'N/A')}")
 
-        if mock.get('environment'):
-            print(f"Environment ID: {mock.get('environment')}")
+        if environment:
+            print(f"Environment ID: {environment}")
 
         print(f"Private: {mock.get('private', False)}")
 
-        if mock.get('config'):
-            config = mock.get('config', {})
+        if config:
+            headers = config.get('headers')
+            delay = config.get('delay')
             print(f"\nConfiguration:")
-            if config.get('headers'):
-                print(f"  Headers: {len(config.get('headers', []))} configured")
-            if config.get('delay'):
-                print(f"  Delay: {config.get('delay')}ms")
+            if headers:
+                print(f"  Headers: {len(headers)} configured")
+            if delay:
+                print(f"  Delay: {delay}ms")
 
         print(f"\nCreated: {mock.get('createdAt', 'N/A')}")
         print(f"Updated: {mock.get('updatedAt', 'N/A')}")
 
-        print(f"\n📋 Mock URL: {mock.get('mockUrl', 'N/A')}")
+        print(f"\n📋 Mock URL: {mock_url}")
         print("   Use this URL to make requests to your mock server")
 
     except Exception as e:
@@ -139,11 +172,26 @@ def create_mock(client, name, collection_id, environment_id=None, private=False,
         sys.exit(1)
 
 
-def delete_mock(client, mock_id):
+def _require_interactive():
+    """Exit with guidance when a confirmation prompt can't be answered."""
+    if not sys.stdin.isatty():
+        print("Error: confirmation needs an interactive terminal; pass --yes to delete without prompting")
+        sys.exit(1)
+
+
+def delete_mock(client, mock_id, assume_yes=False):
     """Delete a mock server."""
     print(f"=== Deleting Mock Server {mock_id} ===\n")
 
     try:
+        if assume_yes:
+            # Nothing to confirm, so skip the lookup round trip
+            client.delete_mock(mock_id)
+            print(f"✓ Mock server deleted successfully!")
+            return
+
+        _require_interactive()
+
         # Get mock details first
         mock = client.get_mock(mock_id)
         print(f"Mock to delete: {mock.get('name', 'Unnamed Mock')}")
@@ -164,6 +212,75 @@ def delete_mock(client, mock_id):
         sys.exit(1)
 
 
+def _call_safely(func, *args):
+    """Run func(*args), returning (result, None) or (None, exception)."""
+    try:
+        return func(*args), None
+    except Exception as e:
+        return None, e
+
+
+def delete_mocks(client, mock_ids, assume_yes=False):
+    """Delete several mock servers after a single confirmation."""
+    print(f"=== Deleting {len(mock_ids)} Mock Servers ===\n")
+
+    if not assume_yes:
+        _require_interactive()
+
+    if assume_yes:
+        found = mock_ids
+    else:
+        found = _confirm_mocks(client, mock_ids)
+        if found is None:
+            return
+
+    # Up to config.max_concurrency deletes at once; errors are collected per ID
+    results = client.gather(*(partial(_call_safely, client.delete_mock, mock_id) for mock_id in found))
+
+    failed = 0
+    for mock_id, (_, error) in zip(found, results):
+        if error:
+            failed += 1
+            print(f"✗ {mock_id}: {error}")
+        else:
+            print(f"✓ {mock_id} deleted")
+
+    if failed or len(found) < len(mock_ids):
+        sys.exit(1)
+    print(f"\n✓ {len(found)} mock server(s) deleted successfully!")
+
+
+def _confirm_mocks(client, mock_ids):
+    """
+    Show the mocks about to be deleted and ask once.
+
+    Returns:
+        IDs that resolved and were confirmed, or None if cancelled
+    """
+    # Look up every mock concurrently so the confirmation shows what will go
+    lookups = client.gather(*(partial(_call_safely, client.get_mock, mock_id) for mock_id in mock_ids))
+
+    found = []
+    for mock_id, (mock, error) in zip(mock_ids, lookups):
+        if error:
+            print(f"✗ {mock_id}: {error}")
+            continue
+        print(f"Mock to delete: {mock.get('name', 'Unnamed Mock')} ({mock_id})")
+        print(f"   Mock URL: {mock.get('mockUrl', 'N/A')}")
+        found.append(mock_id)
+    print()
+
+    if not found:
+        print("No mock servers to delete")
+        sys.exit(1)
+
+    response = input(f"Are you sure you want to delete these {len(found)} mock server(s)? (yes/no): ")
+    if response.lower() not in ['yes', 'y']:
+        print("Deletion cancelled")
+        return None
+    return found
+
+
 def update_mock(client, mock_id, name=None, private=None):
     """Update a mock server."""
     print(f"=== Updating Mock Server {mock_id} ===\n")
@@ -195,32 +312,12 @@ def update_mock(client, mock_id, name=None, private=None):
         sys.exit(1)
 
 
-def main():
-    """Main entry point for mock server management."""
-
+def _build_parser():
+    """Build the argument parser for this CLI."""
     parser = argparse.ArgumentParser(
         description='Manage Postman mock servers',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List all mock servers
-  python manage_mocks.py --list
-
-  # Get mock server details
-  python manage_mocks.py --get abc-123
-
-  # Create a mock server
-  python manage_mocks.py --create --name="Payment Mock" --collection=col-456
-
-  # Create a private mock with delay
-  python manage_mocks.py --create --name="Test Mock" --collection=col-456 --private --delay=1000
-
-  # Update mock server
-  python manage_mocks.py --update abc-123 --name="New Name" --private
-
-  # Delete mock server
-  python manage_mocks.py --delete abc-123
-        """
+        epilog=_EPILOG
     )
 
     # Operation flags
@@ -228,7 +325,8 @@ Examples:
     parser.add_argument('--get', metavar='MOCK_ID', help='Get mock server details')
     parser.add_argument('--create', action='store_true', help='Create a new mock server')
     parser.add_argument('--update', metavar='MOCK_ID', help='Update a mock server')
-    parser.add_argument('--delete', metavar='MOCK_ID', help='Delete a mock server')
+    parser.add_argument('--delete', metavar='MOCK_ID[,MOCK_ID...]',
+                        help='Delete a mock server (comma-separate IDs to delete several)')
 
     # Create/Update parameters
     parser.add_argument('--name', help='Mock server name')
@@ -236,7 +334,18 @@ Examples:
     parser.add_argument('--environment', help='Environment ID (optional)')
     parser.add_argument('--private', action='store_true', help='Make mock server private')
     parser.add_argument('--delay', type=int, help='Response delay in milliseconds')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='With --delete: skip the lookup and confirmation prompt')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the response cache (~/.cache/postman-cli)')
+
+    return parser
+
 
+def main():
+    """Main entry point for mock server management."""
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Check if any operation is specified
@@ -244,8 +353,10 @@ Examples:
         parser.print_help()
         return
 
-    # Initialize client
-    client = PostmanClient()
+    # Initialize client (imported here so --help never loads the HTTP stack)
+    from scripts.postman_client import PostmanClient
+    from utils.response_cache import cli_cache
+    client = PostmanClient(cache=cli_cache(args.no_cache))
 
     # Execute operations
     if args.list:
@@ -273,7 +384,14 @@ Examples:
         update_mock(client, args.update, args.name, args.private)
 
     elif args.delete:
-        delete_mock(client, args.delete)
+        mock_ids = [mock_id.strip() for mock_id in args.delete.split(',') if mock_id.strip()]
+        if not mock_ids:
+            print("Error: --delete needs at least one mock server ID")
+            sys.exit(1)
+        if len(mock_ids) == 1:
+            delete_mock(client, mock_ids[0], assume_yes=args.yes)
+        else:
+            delete_mocks(client, mock_ids, assume_yes=args.yes)
 
 
 if __name__ == '__main__':
@@ -7,15 +7,33 @@ Part of Phase 6: Observe - Monitor Operations
 import sys
 import os
 import argparse
-import json
-from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from scripts.config import get_config
-from scripts.postman_client import PostmanClient
-from utils.formatters import format_error
+from utils.formatters import format_error, parse_timestamp
+
+
+_EPILOG = """
+Examples:
+  # List all monitors
+  python manage_monitors.py --list
+
+  # Get monitor details
+  python manage_monitors.py --details <monitor-id>
+
+  # Create a monitor
+  python manage_monitors.py --create --name "API Health Check" --collection <collection-uid>
+
+  # Update a monitor
+  python manage_monitors.py --update <monitor-id> --name "New Name" --activate
+
+  # Delete a monitor
+  python manage_monitors.py --delete <monitor-id> --confirm
+
+  # Analyze monitor runs
+  python manage_monitors.py --analyze <monitor-id> --limit 20
+"""
 
 
 def list_monitors(client, verbose=False):
@@ -27,28 +45,35 @@ def list_monitors(client, verbose=False):
             print("No monitors found in this workspace.")
             return
 
-        print(f"Found {len(monitors)} monitor(s)")
-        print("=" * 80)
-        print()
+        # Collect the listing and write it in one go
+        output = []
+        output.append(f"Found {len(monitors)} monitor(s)")
+        output.append("=" * 80)
+        output.append("")
 
         for monitor in monitors:
             status = "✓ Active" if monitor.get('active', False) else "✗ Inactive"
-            print(f"{status} {monitor.get('name', 'Unnamed Monitor')}")
-            print(f"   ID: {monitor.get('id')}")
-            print(f"   UID: {monitor.get('uid')}")
+            output.append(f"{status} {monitor.get('name', 'Unnamed Monitor')}")
+            output.append(f"   ID: {monitor.get('id')}")
+            output.append(f"   UID: {monitor.get('uid')}")
 
             if verbose:
-                if monitor.get('collectionUid'):
-                    print(f"   Collection: {monitor.get('collectionUid')}")
-                if monitor.get('environmentUid'):
-                    print(f"   Environment: {monitor.get('environmentUid')}")
-                if monitor.get('schedule'):
-                    schedule = monitor.get('schedule', {})
-                    print(f"   Schedule: {schedule.get('cron', 'Not set')}")
-                if monitor.get('lastRun'):
-                    print(f"   Last Run: {monitor.get('lastRun', {}).get('finishedAt', 'Never')}")
-
-            print()
+                collection_uid = monitor.get('collectionUid')
+                environment_uid = monitor.get('environmentUid')
+                schedule = monitor.get('schedule')
+                last_run = monitor.get('lastRun')
+                if collection_uid:
+                    output.append(f"   Collection: {collection_uid}")
+                if environment_uid:
+                    output.append(f"   Environment: {environment_uid}")
+                if schedule:
+                    output.append(f"   Schedule: {schedule.get('cron', 'Not set')}")
+                if last_run:
+                    output.append(f"   Last Run: {last_run.get('finishedAt', 'Never')}")
+
+            output.append("")
+
+        print("\n".join(output))
 
     except Exception as e:
         print(format_error("listing monitors", e))
@@ -73,29 +98,32 @@ def get_monitor_details(client, monitor_id):
         print(f"Status: {'Active' if monitor.get('active', False) else 'Inactive'}")
         print()
 
+        environment = monitor.get('environment')
+        schedule = monitor.get('schedule')
+        last_run = monitor.get('lastRun')
+
         print("Configuration:")
         print(f"  Collection: {monitor.get('collection')}")
-        if monitor.get('environment'):
-            print(f"  Environment: {monitor.get('environment')}")
+        if environment:
+            print(f"  Environment: {environment}")
 
-        if monitor.get('schedule'):
-            schedule = monitor.get('schedule', {})
+        if schedule:
             print(f"  Schedule: {schedule.get('cron', 'Not configured')}")
             print(f"  Timezone: {schedule.get('timezone', 'UTC')}")
 
         print()
 
-        if monitor.get('lastRun'):
-            last_run = monitor.get('lastRun', {})
+        if last_run:
             print("Last Run:")
             print(f"  Status: {last_run.get('status', 'Unknown')}")
             print(f"  Started: {last_run.get('startedAt', 'N/A')}")
             print(f"  Finished: {last_run.get('finishedAt', 'N/A')}")
 
-            stats = last_run.get('stats', {})
+            stats = last_run.get('stats')
             if stats:
-                print(f"  Assertions: {stats.get('assertions', {}).get('total', 0)} total, "
-                      f"{stats.get('assertions', {}).get('failed', 0)} failed")
+                assertions = stats.get('assertions') or {}
+                print(f"  Assertions: {assertions.get('total', 0)} total, "
+                      f"{assertions.get('failed', 0)} failed")
 
         print()
 
@@ -186,6 +214,15 @@ def delete_monitor(client, monitor_id, confirm=False):
         sys.exit(1)
 
 
+def _format_duration(started, finished):
+    """Format the time between two API timestamps as e.g. '12.3s', or 'N/A'"""
+    start_dt = parse_timestamp(started)
+    finish_dt = parse_timestamp(finished)
+    if start_dt is None or finish_dt is None:
+        return "N/A"
+    return f"{(finish_dt - start_dt).total_seconds():.1f}s"
+
+
 def analyze_monitor_runs(client, monitor_id, limit=10):
     """Analyze monitor run history"""
     try:
@@ -195,83 +232,63 @@ def analyze_monitor_runs(client, monitor_id, limit=10):
             print(f"No run history found for monitor {monitor_id}.")
             return
 
-        print(f"Monitor Run History (Last {len(runs)} runs)")
-        print("=" * 80)
-        print()
-
-        total_runs = len(runs)
-        successful_runs = sum(1 for run in runs if run.get('status') == 'success')
-        failed_runs = total_runs - successful_runs
-
-        print(f"Summary:")
-        print(f"  Total Runs: {total_runs}")
-        print(f"  Successful: {successful_runs} ({successful_runs/total_runs*100:.1f}%)")
-        print(f"  Failed: {failed_runs} ({failed_runs/total_runs*100:.1f}%)")
-        print()
-
-        print("Recent Runs:")
-        print("-" * 80)
-
+        # Render the runs and count successes in the same pass; the summary
+        # that precedes them is filled in afterwards
+        run_lines = []
+        successful_runs = 0
         for i, run in enumerate(runs, 1):
             status = run.get('status', 'unknown')
-            status_icon = "✓" if status == 'success' else "✗"
+            if status == 'success':
+                successful_runs += 1
+                status_icon = "✓"
+            else:
+                status_icon = "✗"
 
             started = run.get('startedAt', 'N/A')
-            finished = run.get('finishedAt', 'N/A')
-
-            # Calculate duration if both timestamps available
-            duration = "N/A"
-            if started != 'N/A' and finished != 'N/A':
-                try:
-                    start_dt = datetime.fromisoformat(started.replace('Z', '+00:00'))
-                    finish_dt = datetime.fromisoformat(finished.replace('Z', '+00:00'))
-                    duration_seconds = (finish_dt - start_dt).total_seconds()
-                    duration = f"{duration_seconds:.1f}s"
-                except:
-                    pass
-
-            print(f"{i}. {status_icon} {status.upper()}")
-            print(f"   Started: {started}")
-            print(f"   Duration: {duration}")
-
-            stats = run.get('stats', {})
+            duration = _format_duration(started, run.get('finishedAt'))
+
+            run_lines.append(f"{i}. {status_icon} {status.upper()}")
+            run_lines.append(f"   Started: {started}")
+            run_lines.append(f"   Duration: {duration}")
+
+            stats = run.get('stats')
             if stats:
-                assertions = stats.get('assertions', {})
-                requests = stats.get('requests', {})
-                print(f"   Requests: {requests.get('total', 0)} total, {requests.get('failed', 0)} failed")
-                print(f"   Assertions: {assertions.get('total', 0)} total, {assertions.get('failed', 0)} failed")
+                assertions = stats.get('assertions') or {}
+                requests = stats.get('requests') or {}
+                run_lines.append(f"   Requests: {requests.get('total', 0)} total, {requests.get('failed', 0)} failed")
+                run_lines.append(f"   Assertions: {assertions.get('total', 0)} total, {assertions.get('failed', 0)} failed")
+
+            run_lines.append("")
+
+        total_runs = len(runs)
+        failed_runs = total_runs - successful_runs
 
-            print()
+        output = []
+        output.append(f"Monitor Run History (Last {total_runs} runs)")
+        output.append("=" * 80)
+        output.append("")
+        output.append(f"Summary:")
+        output.append(f"  Total Runs: {total_runs}")
+        output.append(f"  Successful: {successful_runs} ({successful_runs/total_runs*100:.1f}%)")
+        output.append(f"  Failed: {failed_runs} ({failed_runs/total_runs*100:.1f}%)")
+        output.append("")
+        output.append("Recent Runs:")
+        output.append("-" * 80)
+        output.extend(run_lines)
+
+        print("\n".join(output))
 
     except Exception as e:
         print(format_error("analyzing monitor runs", e))
         sys.exit(1)
 
 
-def main():
+def _build_parser():
+    """Build the argument parser for this CLI."""
     parser = argparse.ArgumentParser(
         description='Manage Postman Monitors',
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List all monitors
-  python manage_monitors.py --list
-
-  # Get monitor details
-  python manage_monitors.py --details <monitor-id>
-
-  # Create a monitor
-  python manage_monitors.py --create --name "API Health Check" --collection <collection-uid>
-
-  # Update a monitor
-  python manage_monitors.py --update <monitor-id> --name "New Name" --activate
-
-  # Delete a monitor
-  python manage_monitors.py --delete <monitor-id> --confirm
-
-  # Analyze monitor runs
-  python manage_monitors.py --analyze <monitor-id> --limit 20
-        """
+        epilog=_EPILOG
     )
 
     # Actions
@@ -292,7 +309,14 @@ Examples:
     parser.add_argument('--confirm', action='store_true', help='Confirm deletion')
     parser.add_argument('--limit', type=int, default=10, help='Number of runs to analyze (default: 10)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the response cache (~/.cache/postman-cli)')
 
+    return parser
+
+
+def main():
+    parser = _build_parser()
     args = parser.parse_args()
 
     # Validate arguments
@@ -300,9 +324,12 @@ Examples:
         parser.print_help()
         sys.exit(1)
 
-    # Get configuration and create client
+    # Get configuration and create client (imported here so --help never loads the HTTP stack)
+    from scripts.config import get_config
+    from scripts.postman_client import PostmanClient
+    from utils.response_cache import cli_cache
     config = get_config()
-    client = PostmanClient(config)
+    client = PostmanClient(config, cache=cli_cache(args.no_cache))
 
     # Execute action
     if args.list:
@@ -18,14 +18,26 @@ Usage:
 
 import sys
 import os
-import json
 import argparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from scripts.postman_client import PostmanClient
-from scripts.config import PostmanConfig
+
+_EPILOG = """
+Examples:
+  # Create a spec from file
+  python manage_spec.py create --name="Payment API" --file=openapi.json
+
+  # List all specs
+  python manage_spec.py list
+
+  # Get spec details
+  python manage_spec.py get --spec-id=abc-123
+
+  # Generate collection from spec
+  python manage_spec.py generate-collection --spec-id=abc-123 --collection-name="My API Collection"
+"""
 
 
 def load_spec_file(file_path):
@@ -37,20 +49,74 @@ def load_spec_file(file_path):
     if file_path.endswith('.yaml') or file_path.endswith('.yml'):
         try:
             import yaml
-            # Verify it's valid YAML and return as string
-            yaml.safe_load(content)
+            # Verify it's valid YAML and return as string; prefer the libyaml
+            # C loader when PyYAML was built with it
+            loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+            yaml.load(content, Loader=loader)
             return content, 'yaml'
         except ImportError:
             print("Warning: PyYAML not installed. Treating as JSON.")
             return content, 'json'
     else:
+        from utils.jsonlib import loads
         # Verify it's valid JSON
-        json.loads(content)
+        loads(content)
         return content, 'json'
 
 
-def create_spec(client, name, description, file_path):
-    """Create a specification in Spec Hub."""
+def _spec_hashes_path():
+    """Location of the record of previously uploaded spec files."""
+    from utils.response_cache import DEFAULT_CACHE_DIR
+    return DEFAULT_CACHE_DIR / 'spec_hashes.json'
+
+
+def _load_spec_hashes():
+    """Load {record key: upload record}; empty if missing or unreadable."""
+    import json
+    try:
+        with open(_spec_hashes_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_spec_hashes(records):
+    """Persist upload records (best-effort; a failed write only costs a re-upload)."""
+    import json
+    import threading
+    path = _spec_hashes_path()
+    # Write a private temp file and swap it in, so a crash or a concurrent
+    # run never leaves a truncated record behind
+    tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _content_hash(content):
+    """Digest identifying a spec file's content in the upload record."""
+    import hashlib
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def create_spec(client, name, description, file_path, force=False, reuse=True):
+    """
+    Create a specification in Spec Hub.
+
+    If the same file was already uploaded to the same workspace with the same
+    API key, name, description and content, and that spec still exists with
+    the same root file content, its ID is reused instead of uploading again.
+    Pass force=True to always upload, or reuse=False to neither consult nor
+    update the upload record.
+    """
+    from utils.exceptions import PostmanAPIError
 
     print(f"=== Creating Spec: {name} ===\n")
 
@@ -62,6 +128,30 @@ def create_spec(client, name, description, file_path):
         print(f"✗ Error loading spec file: {e}")
         return None
 
+    # Skip the upload when nothing changed since the last one. Records are
+    # per account and workspace: the same file may live in several.
+    content_hash = _content_hash(spec_content)
+    record_key = "|".join((client.cache_scope, client.config.workspace_id or '',
+                           os.path.abspath(file_path)))
+    records = _load_spec_hashes() if reuse else {}
+    previous = records.get(record_key)
+
+    if (not force and previous
+            and previous.get('hash') == content_hash
+            and previous.get('name') == name
+            and previous.get('description') == description):
+        try:
+            existing = client.get_spec(previous['spec_id'], use_cache=False)
+        except PostmanAPIError:
+            existing = None  # Deleted or not visible to this key; upload again
+        # The spec may also have been edited since (e.g. update_spec_file)
+        root_file = next((f for f in (existing or {}).get('files', []) if f.get('root')), None)
+        if root_file is not None and _content_hash(root_file.get('content') or '') == content_hash:
+            print(f"✓ Unchanged since last upload, reusing spec_id={previous['spec_id']}")
+            print("  (use --force to upload anyway)")
+            print()
+            return previous['spec_id']
+
     # Prepare spec data
     spec_data = {
         "name": name,
@@ -78,6 +168,14 @@ def create_spec(client, name, description, file_path):
     try:
         spec = client.create_spec(spec_data)
         spec_id = spec.get('id')
+        if spec_id and reuse:
+            records[record_key] = {
+                "name": name,
+                "description": description,
+                "hash": content_hash,
+                "spec_id": spec_id,
+            }
+            _save_spec_hashes(records)
         print(f"✓ Specification created successfully in Spec Hub!")
         print(f"  Spec ID: {spec_id}")
         print(f"  Name: {spec.get('name')}")
@@ -89,6 +187,62 @@ def create_spec(client, name, description, file_path):
         return None
 
 
+# Spec content above this size is summarized with a streaming parser when
+# ijson's C backend is available, instead of being fully deserialized
+_STREAM_SUMMARY_THRESHOLD = 1024 * 1024
+
+
+def _summarize_spec_streaming(content, ijson_backend):
+    """Collect summary fields from JSON spec text without building the document."""
+    summary = {}
+    endpoints = schemas = 0
+    for prefix, event, value in ijson_backend.parse(content.encode('utf-8')):
+        if event == 'map_key':
+            if prefix == '':
+                if value in ('info', 'paths', 'components'):
+                    summary[value] = True
+            elif prefix == 'paths':
+                endpoints += 1
+            elif prefix == 'components.schemas':
+                schemas += 1
+        elif prefix in ('openapi', 'asyncapi', 'info.title', 'info.version'):
+            summary[prefix] = value
+    return {
+        'type': summary.get('openapi', summary.get('asyncapi', 'Unknown')),
+        'info': (summary.get('info.title'), summary.get('info.version')) if 'info' in summary else None,
+        'endpoints': endpoints if 'paths' in summary else None,
+        'schemas': schemas if 'components' in summary else None,
+    }
+
+
+def _summarize_spec(content):
+    """
+    Extract spec type, title, version and endpoint/schema counts from JSON
+    spec text.
+
+    Returns:
+        Dict with 'type', 'info' ((title, version) or None), 'endpoints' and
+        'schemas' (counts, or None when the section is absent)
+    """
+    if len(content) > _STREAM_SUMMARY_THRESHOLD:
+        try:
+            import ijson
+            return _summarize_spec_streaming(content, ijson.get_backend('yajl2_c'))
+        except ImportError:
+            pass  # ijson or its C backend not installed; parse normally
+
+    from utils.jsonlib import loads
+    spec_parsed = loads(content)
+    info = spec_parsed.get('info', {}) if 'info' in spec_parsed else None
+    return {
+        'type': spec_parsed.get('openapi', spec_parsed.get('asyncapi', 'Unknown')),
+        'info': (info.get('title'), info.get('version')) if info is not None else None,
+        'endpoints': len(spec_parsed.get('paths', {})) if 'paths' in spec_parsed else None,
+        'schemas': (len(spec_parsed.get('components', {}).get('schemas', {}))
+                    if 'components' in spec_parsed else None),
+    }
+
+
 def get_spec(client, spec_id):
     """Retrieve and display specification details."""
 
@@ -114,15 +268,15 @@ def get_spec(client, spec_id):
         if files:
             first_file = files[0]
             try:
-                spec_parsed = json.loads(first_file.get('content', '{}'))
-                print(f"\n  Spec Type: {spec_parsed.get('openapi', spec_parsed.get('asyncapi', 'Unknown'))}")
-                if 'info' in spec_parsed:
-                    print(f"  Title: {spec_parsed.get('info', {}).get('title')}")
-                    print(f"  Version: {spec_parsed.get('info', {}).get('version')}")
-                if 'paths' in spec_parsed:
-                    print(f"  Endpoints: {len(spec_parsed.get('paths', {}))}")
-                if 'components' in spec_parsed:
-                    print(f"  Schemas: {len(spec_parsed.get('components', {}).get('schemas', {}))}")
+                summary = _summarize_spec(first_file.get('content', '{}'))
+                print(f"\n  Spec Type: {summary['type']}")
+                if summary['info'] is not None:
+                    print(f"  Title: {summary['info'][0]}")
+                    print(f"  Version: {summary['info'][1]}")
+                if summary['endpoints'] is not None:
+                    print(f"  Endpoints: {summary['endpoints']}")
+                if summary['schemas'] is not None:
+                    print(f"  Schemas: {summary['schemas']}")
             except:
                 pass  # Not JSON or can't parse
         print()
@@ -130,13 +284,16 @@ def get_spec(client, spec_id):
         print(f"✗ Error retrieving specification: {e}")
 
 
-def list_specs(client, limit=10):
-    """List all specifications in workspace."""
+def list_specs(client, limit=10, fetch_all=False):
+    """List specifications in workspace (every page when fetch_all is set)."""
 
     print("=== Listing Specifications ===\n")
 
     try:
-        specs = client.list_specs(limit=limit)
+        if fetch_all:
+            specs = list(client.iter_specs())
+        else:
+            specs = client.list_specs(limit=limit)
         if not specs:
             print("No specifications found in workspace")
         else:
@@ -182,57 +339,89 @@ def generate_collection_from_spec(client, spec_id, collection_name):
         print("  Note: Collection generation may be asynchronous")
 
 
-def main():
-    """Main workflow for Spec Hub management."""
-
-    parser = argparse.ArgumentParser(
-        description='Create and manage API specifications in Postman Spec Hub',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Create a spec from file
-  python manage_spec.py create --name="Payment API" --file=openapi.json
-
-  # List all specs
-  python manage_spec.py list
-
-  # Get spec details
-  python manage_spec.py get --spec-id=abc-123
-
-  # Generate collection from spec
-  python manage_spec.py generate-collection --spec-id=abc-123 --collection-name="My API Collection"
-        """
-    )
-
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-
-    # Create command
+def _add_create_parser(subparsers):
     create_parser = subparsers.add_parser('create', help='Create a new specification')
     create_parser.add_argument('--name', required=True, help='Specification name')
     create_parser.add_argument('--description', help='Specification description')
     create_parser.add_argument('--file', required=True, help='Path to OpenAPI/AsyncAPI spec file')
+    create_parser.add_argument('--force', action='store_true',
+                               help='Upload even if this file was already uploaded unchanged')
+
 
-    # List command
+def _add_list_parser(subparsers):
     list_parser = subparsers.add_parser('list', help='List all specifications')
     list_parser.add_argument('--limit', type=int, default=10, help='Maximum number of specs to return')
+    list_parser.add_argument('--all', action='store_true', dest='fetch_all',
+                             help='List every specification, ignoring --limit')
 
-    # Get command
+
+def _add_get_parser(subparsers):
     get_parser = subparsers.add_parser('get', help='Get specification details')
     get_parser.add_argument('--spec-id', required=True, help='Specification ID')
 
-    # Generate collection command
+
+def _add_generate_collection_parser(subparsers):
     gen_parser = subparsers.add_parser('generate-collection', help='Generate collection from spec')
     gen_parser.add_argument('--spec-id', required=True, help='Specification ID')
     gen_parser.add_argument('--collection-name', required=True, help='Name for generated collection')
 
+
+# Subcommand name -> function that registers its subparser
+_SUBPARSER_BUILDERS = {
+    'create': _add_create_parser,
+    'list': _add_list_parser,
+    'get': _add_get_parser,
+    'generate-collection': _add_generate_collection_parser,
+}
+
+
+def _build_parser(argv=None):
+    """
+    Build the argument parser for this CLI.
+
+    Only the subparser named by the first positional argument is
+    registered; top-level help, a missing command, or an unknown command
+    registers all of them so usage and error messages list every choice.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description='Create and manage API specifications in Postman Spec Hub',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
+    )
+
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the response cache and the record of earlier '
+                             'uploads (~/.cache/postman-cli)')
+
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        for add_subparser in _SUBPARSER_BUILDERS.values():
+            add_subparser(subparsers)
+
+    return parser
+
+
+def main():
+    """Main workflow for Spec Hub management."""
+
+    parser = _build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return
 
-    # Initialize client
-    client = PostmanClient()
+    # Initialize client (imported here so --help never loads the HTTP stack)
+    from scripts.postman_client import PostmanClient
+    from utils.response_cache import cli_cache
+    client = PostmanClient(cache=cli_cache(args.no_cache))
 
     # Execute command
     if args.command == 'create':
@@ -240,7 +429,8 @@ Examples:
             print(f"Error: Spec file not found: {args.file}")
             return
 
-        spec_id = create_spec(client, args.name, args.description, args.file)
+        spec_id = create_spec(client, args.name, args.description, args.file,
+                              force=args.force, reuse=not args.no_cache)
 
         if spec_id:
             print("=== Spec Created Successfully ===")
@@ -252,7 +442,7 @@ Examples:
             print(f"  - View in Postman: https://postman.postman.co/workspace/specs")
 
     elif args.command == 'list':
-        list_specs(client, args.limit)
+        list_specs(client, args.limit, fetch_all=args.fetch_all)
 
     elif args.command == 'get':
         get_spec(client, args.spec_id)
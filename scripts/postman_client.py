@@ -6,19 +6,136 @@ import sys
 import os
 import warnings
 import subprocess
-import json
+import hashlib
+import functools
+import threading
+from io import BytesIO
+from concurrent.futures import FIRST_EXCEPTION, Future, ThreadPoolExecutor, wait
+from urllib.parse import quote, urlencode
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.config import PostmanConfig
 from utils.retry_handler import RetryHandler
+from utils import jsonlib
+from utils.response_cache import ResponseCache
 from utils.exceptions import (
     create_exception_from_response,
+    PostmanAPIError,
     NetworkError,
     TimeoutError
 )
 
+# Optional: pycurl drives libcurl in-process, so requests skip the curl
+# fork/exec and reuse connections (falls back to the curl binary)
+try:
+    import pycurl
+except ImportError:
+    pycurl = None
+
+# Negotiate HTTP/2 over TLS (via ALPN) when libcurl is built with it, so a
+# reused connection can carry concurrent streams. Falls back to HTTP/1.1.
+_PYCURL_HTTP_VERSION = None
+if pycurl is not None and pycurl.version_info()[4] & pycurl.VERSION_HTTP2:
+    _PYCURL_HTTP_VERSION = pycurl.CURL_HTTP_VERSION_2TLS
+
+
+# Arguments every curl invocation starts with:
+# silent, skip cert verification, include headers
+_CURL_BASE_ARGS = ('curl', '-s', '-k', '-i')
+_JSON_CONTENT_TYPE = 'Content-Type: application/json'
+_JSON_CONTENT_TYPE_FLAGS = ('-H', _JSON_CONTENT_TYPE)
+
+# libcurl error code for an expired timeout (curl exit code 28)
+_CURLE_OPERATION_TIMEDOUT = 28
+
+# Substrings that mark an environment variable as sensitive. Keywords that
+# contain another one ("api_key", "authorization") are covered by it.
+_SENSITIVE_KEYWORDS = (
+    'key', 'token', 'secret', 'password', 'passwd',
+    'pwd', 'auth', 'credential', 'private', 'bearer'
+)
+
+# Keys inside a "collection" object that only v10+ responses carry
+_V10_COLLECTION_KEYS = frozenset(('fork', 'meta'))
+
+
+def _with_query(path, **params):
+    """
+    Append URL-encoded query parameters to an endpoint path.
+
+    Parameters that are None, empty or 0 are left out so the API defaults apply.
+    """
+    query = urlencode({key: value for key, value in params.items() if value})
+    return f"{path}?{query}" if query else path
+
+
+def _get_header(headers, name):
+    """Case-insensitive response header lookup (HTTP/2 headers are lowercase)."""
+    name = name.lower()
+    return next((v for k, v in headers.items() if k.lower() == name), None)
+
+
+def _cache_lifetime(headers, ttl):
+    """
+    Apply the response's Cache-Control to a requested cache TTL.
+
+    Returns:
+        Seconds to keep the response (0 = store but always revalidate),
+        or None if it must not be stored at all
+    """
+    cache_control = (_get_header(headers, 'Cache-Control') or '').lower()
+    if not cache_control:
+        return ttl
+
+    directives = [d.strip() for d in cache_control.split(',')]
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith('max-age='):
+            try:
+                return min(ttl, int(directive[len('max-age='):]))
+            except ValueError:
+                break
+    return ttl
+
+
+@functools.lru_cache(maxsize=1024)
+def _detect_secret_type(key):
+    """
+    Return 'secret' if a variable name looks sensitive, else 'default'.
+
+    Memoized because the same variable names recur across environments.
+    A substring loop is faster than an alternation regex on keys this short.
+    """
+    key_lower = key.lower()
+    for keyword in _SENSITIVE_KEYWORDS:
+        if keyword in key_lower:
+            return 'secret'
+    return 'default'
+
+
+class _MockResponse:
+    """Minimal requests.Response stand-in returned by the curl transports."""
+
+    __slots__ = ('status_code', 'headers', '_body', '_data')
+
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = headers
+        self._body = body
+        self._data = None
+
+    def json(self):
+        # Parsed once: version detection, error handling and the
+        # caller all read the same response
+        if self._data is None:
+            self._data = jsonlib.loads(self._body) if self._body else {}
+        return self._data
+
 
 class PostmanClient:
     """
@@ -26,14 +143,144 @@ class PostmanClient:
     Handles authentication, retries, and response parsing.
 
     Supports Postman v10+ APIs with backward compatibility detection.
+
+    GET responses for reads that opt in via `cache_ttl` are kept in an
+    in-memory cache for the client's lifetime. Pass a ResponseCache with a
+    cache_dir as `cache` to persist them across runs, or cache=False to
+    disable caching.
     """
 
-    def __init__(self, config=None):
+    # Cache lifetimes of monitor, mock, spec, API and workspace GETs as
+    # multiples of config.cache_ttl (60s and 300s at the default of 30s)
+    LIST_CACHE_TTL_FACTOR = 2
+    ITEM_CACHE_TTL_FACTOR = 10
+
+    # Set after the first create_api() deprecation warning
+    _create_api_warned = False
+
+    def __init__(self, config=None, cache=None):
         self.config = config or PostmanConfig()
         self.config.validate()
-        self.retry_handler = RetryHandler(max_retries=self.config.max_retries)
+        self.retry_handler = RetryHandler(
+            max_retries=self.config.max_retries,
+            base_delay=self.config.retry_base_delay,
+            max_delay=self.config.retry_max_delay
+        )
+        # Read once; set client.debug to toggle request/response tracing
+        self.debug = bool(os.getenv('POSTMAN_DEBUG'))
         self.api_version = None  # Will be detected on first request
         self.api_version_warned = False  # Track if we've warned about old version
+        cache_ttl = self.config.cache_ttl
+        self.list_cache_ttl = cache_ttl * self.LIST_CACHE_TTL_FACTOR
+        self.item_cache_ttl = cache_ttl * self.ITEM_CACHE_TTL_FACTOR
+        # POSTMAN_CACHE_TTL=0 turns caching off, including a cache passed in
+        if cache_ttl <= 0:
+            cache = False
+        elif cache is None:
+            cache = ResponseCache()
+        self.cache = cache or None
+        # Cache entries are scoped per API key so accounts never share responses
+        self._cache_scope = hashlib.sha256(self.config.api_key.encode('utf-8')).hexdigest()[:16]
+
+        # Header flags are the same for every request, so build them once.
+        # JSON bodies only need an explicit Content-Type if config lacks one.
+        self._header_lines = []
+        self._header_flags = []
+        has_content_type = False
+        for key, value in self.config.headers.items():
+            has_content_type = has_content_type or key.lower() == 'content-type'
+            self._header_lines.append(f"{key}: {value}")
+            self._header_flags.extend(['-H', f"{key}: {value}"])
+        self._body_header_lines = () if has_content_type else (_JSON_CONTENT_TYPE,)
+        self._body_header_flags = () if has_content_type else _JSON_CONTENT_TYPE_FLAGS
+
+        # libcurl easy handles are not thread-safe, so each in-flight request
+        # checks one out of a pool. All handles share one connection cache,
+        # DNS cache and TLS session cache, so gather() workers reuse sockets
+        # opened by earlier requests.
+        self._use_pycurl = pycurl is not None and self.config.use_pycurl
+        self._idle_curl_handles = []
+        self._curl_lock = threading.Lock()
+        # In-flight GETs by (url, extra headers), for single-flight coalescing
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._curl_share = None
+        if self._use_pycurl:
+            self._curl_share = pycurl.CurlShare()
+            for data in (pycurl.LOCK_DATA_CONNECT, pycurl.LOCK_DATA_DNS,
+                         pycurl.LOCK_DATA_SSL_SESSION):
+                self._curl_share.setopt(pycurl.SH_SHARE, data)
+
+    def _send_once(self, key, send, send_args):
+        """
+        Send a GET, coalescing concurrent identical requests (single-flight).
+
+        The first caller performs the request; callers arriving while it is
+        in flight wait for it and get a copy of the same response (or the
+        same exception). Copies parse their own JSON, so callers that mutate
+        the result never share objects.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            response = future.result()
+            return _MockResponse(response.status_code, dict(response.headers), response._body)
+
+        try:
+            response = self.retry_handler.execute(send, *send_args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    @property
+    def cache_enabled(self):
+        """Whether GET responses are being cached."""
+        return self.cache is not None
+
+    @property
+    def cache_scope(self):
+        """Short digest identifying this client's API key (never the key itself)."""
+        return self._cache_scope
+
+    def invalidate_cache(self, endpoint):
+        """
+        Drop cached responses for the endpoint's resource type.
+
+        Writes made through this client do this automatically; call it after
+        changing resources some other way (e.g. in the Postman app).
+
+        Args:
+            endpoint: Any endpoint of the resource, e.g. "/specs" or "/specs/abc"
+        """
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_scope, endpoint)
+            self.cache.invalidate(self._cache_scope, '/workspaces')
+
+    def close(self):
+        """Release pooled connections. The client must not be used afterwards."""
+        with self._curl_lock:
+            handles, self._idle_curl_handles = self._idle_curl_handles, []
+        for handle in handles:
+            handle.close()
+        if self._curl_share is not None:
+            self._curl_share.close()
+            self._curl_share = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _detect_api_version(self, response):
         """
@@ -43,8 +290,11 @@ class PostmanClient:
         Args:
             response: requests.Response object
         """
+        if self.api_version is not None:
+            return
+
         # Try X-API-Version header first
-        version_header = response.headers.get('X-API-Version')
+        version_header = _get_header(response.headers, 'X-API-Version')
         if version_header:
             self.api_version = version_header
             return
@@ -74,15 +324,14 @@ class PostmanClient:
         Returns:
             True if response appears to be v10+, False otherwise
         """
-        # Check for v10+ metadata indicators
-        if 'meta' in data:
+        if not isinstance(data, dict):
             return True
 
-        # Check collection/environment structure
-        if 'collection' in data:
-            collection = data['collection']
-            if 'fork' in collection or 'meta' in collection:
-                return True
+        # Check for v10+ metadata indicators, then collection/environment structure
+        collection = data.get('collection')
+        if 'meta' in data or (isinstance(collection, dict) and
+                              not _V10_COLLECTION_KEYS.isdisjoint(collection)):
+            return True
 
         # Default to assuming v10+ (optimistic)
         return True
@@ -99,13 +348,19 @@ class PostmanClient:
             )
             self.api_version_warned = True
 
-    def _make_request(self, method, endpoint, **kwargs):
+    def _make_request(self, method, endpoint, cache_ttl=None, params=None, **kwargs):
         """
         Make an API request with retry logic and enhanced error handling.
 
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             endpoint: API endpoint path (without base URL)
+            cache_ttl: For GETs, seconds to reuse the response from self.cache
+                (None disables caching for this call). Expired entries are
+                revalidated with If-None-Match / If-Modified-Since when the
+                response carried an ETag / Last-Modified validator.
+            params: Query parameters, URL-encoded onto the endpoint. None, empty
+                and 0 values are left out so the API defaults apply.
             **kwargs: Additional arguments (json, headers, etc.)
 
         Returns:
@@ -122,146 +377,73 @@ class PostmanClient:
             TimeoutError: If request times out
             PostmanAPIError: For other API errors
         """
+        if params:
+            endpoint = _with_query(endpoint, **params)
         url = f"{self.config.base_url}{endpoint}"
 
-        # Build curl command
-        curl_cmd = ['curl', '-s', '-k', '-i']  # silent, skip cert verification, include headers
+        # Serve fresh cached GETs without a round trip
+        cached = None
+        use_cache = self.cache is not None and cache_ttl and method.upper() == 'GET'
+        if use_cache:
+            cached = self.cache.get(self._cache_scope, endpoint)
+            if self.cache.is_fresh(cached):
+                return jsonlib.loads(cached['body']) if cached['body'] else {}
+
+        # Add JSON body if provided
+        request_body = None
+        if kwargs.get('json'):
+            # orjson (when installed) serializes large spec content much
+            # faster, straight to the bytes the transports send
+            request_body = jsonlib.dumpb(kwargs['json'])
+
+        # Revalidate an expired cache entry instead of re-downloading it
+        extra_headers = []
+        if cached and cached.get('etag'):
+            extra_headers.append(f"If-None-Match: {cached['etag']}")
+        if cached and cached.get('last_modified'):
+            extra_headers.append(f"If-Modified-Since: {cached['last_modified']}")
 
-        # Add HTTP method for non-GET requests
-        if method.upper() != 'GET':
-            curl_cmd.extend(['-X', method.upper()])
+        timeout = kwargs.get('timeout', self.config.timeout)
 
-        # Add JSON body if provided (before headers to avoid duplicates)
-        has_json_body = 'json' in kwargs and kwargs['json']
-        if has_json_body:
-            json_data = json.dumps(kwargs['json'])
-            curl_cmd.extend(['-d', json_data])
-            curl_cmd.extend(['-H', 'Content-Type: application/json'])
+        if self._use_pycurl:
+            headers = self._header_lines + extra_headers
+            if request_body is not None:
+                headers.extend(self._body_header_lines)
+            send = self._send_pycurl
+            send_args = (method.upper(), url, headers, timeout, request_body)
+        else:
+            # Build curl command
+            curl_cmd = list(_CURL_BASE_ARGS)
 
-        # Add headers (skip Content-Type if we already added it for JSON)
-        for key, value in self.config.headers.items():
-            if key.lower() == 'content-type' and has_json_body:
-                continue  # Skip duplicate Content-Type
-            curl_cmd.extend(['-H', f"{key}: {value}"])
+            # Add HTTP method for non-GET requests
+            if method.upper() != 'GET':
+                curl_cmd.extend(['-X', method.upper()])
 
-        # Add timeout
-        timeout = kwargs.get('timeout', self.config.timeout)
-        curl_cmd.extend(['--max-time', str(timeout)])
+            # The body is piped to curl's stdin rather than passed in argv,
+            # which caps a single argument at 128 KiB on Linux.
+            if request_body is not None:
+                curl_cmd.extend(['--data-binary', '@-'])
+                curl_cmd.extend(self._body_header_flags)
 
-        # Add URL
-        curl_cmd.append(url)
+            curl_cmd.extend(self._header_flags)
+            for header in extra_headers:
+                curl_cmd.extend(['-H', header])
 
-        def execute_curl():
-            """Execute curl command and return parsed response."""
-            try:
-                # Use environment as-is - the proxy is configured correctly
-                # and removing it breaks DNS resolution
-                env = os.environ.copy()
-
-                # Debug: print curl command if POSTMAN_DEBUG is set
-                if os.getenv('POSTMAN_DEBUG'):
-                    print(f"DEBUG: Executing curl command: {' '.join(curl_cmd[:10])}... {url}", file=sys.stderr)
-                    print(f"DEBUG: Using proxy: {env.get('https_proxy', 'none')}", file=sys.stderr)
-
-                result = subprocess.run(
-                    curl_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout + 5,  # Add buffer to subprocess timeout
-                    env=env  # Use environment with proxy intact
-                )
+            # Add timeout and URL
+            curl_cmd.extend(['--max-time', str(timeout)])
+            curl_cmd.append(url)
 
-                if result.returncode != 0:
-                    stderr = result.stderr.strip() if result.stderr else ""
-                    stdout = result.stdout.strip() if result.stdout else ""
-                    error_msg = stderr or stdout or "Unknown curl error"
-                    raise NetworkError(
-                        message=f"Curl failed (exit code {result.returncode}): {error_msg}\n"
-                                f"Command: {' '.join(curl_cmd[:4])}... {url}"
-                    )
-
-                # Parse response (headers + body)
-                output = result.stdout
-                if not output:
-                    raise NetworkError(message="Empty response from curl")
-
-                # Split headers and body
-                parts = output.split('\r\n\r\n', 1)
-                if len(parts) < 2:
-                    parts = output.split('\n\n', 1)
-
-                if len(parts) < 2:
-                    raise NetworkError(message="Invalid response format from curl")
-
-                headers_text, body = parts[0], parts[1]
-
-                # Check if body contains another HTTP response (common with proxies/HTTP2)
-                if body.strip().startswith('HTTP/'):
-                    # The body is actually another HTTP response - parse it instead
-                    nested_parts = body.split('\n\n', 1)
-                    if len(nested_parts) >= 2:
-                        headers_text = nested_parts[0]
-                        body = nested_parts[1] if len(nested_parts) > 1 else ""
-
-                # Debug: print response details if POSTMAN_DEBUG is set
-                if os.getenv('POSTMAN_DEBUG'):
-                    print(f"DEBUG: Headers (first 200 chars): {headers_text[:200]}", file=sys.stderr)
-                    print(f"DEBUG: Response body length: {len(body)}", file=sys.stderr)
-                    print(f"DEBUG: Response body (first 200 chars): {body[:200]}", file=sys.stderr)
-
-                # Extract status code from headers
-                status_line = headers_text.split('\n')[0]
-                status_parts = status_line.split()
-                if len(status_parts) < 2:
-                    raise NetworkError(message=f"Invalid HTTP status line: {status_line}")
-                status_code = int(status_parts[1])
-
-                # Parse response headers
-                response_headers = {}
-                for line in headers_text.split('\n')[1:]:
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        response_headers[key.strip()] = value.strip()
-
-                # Create a mock response object for compatibility
-                class MockResponse:
-                    def __init__(self, status_code, headers, body):
-                        self.status_code = status_code
-                        self.headers = headers
-                        self._body = body
-
-                    def json(self):
-                        return json.loads(self._body) if self._body else {}
-
-                return MockResponse(status_code, response_headers, body)
-
-            except subprocess.TimeoutExpired as e:
-                raise TimeoutError(timeout_seconds=timeout) from e
-            except json.JSONDecodeError as e:
-                # Better error for empty/invalid responses
-                error_msg = (
-                    "Received invalid JSON response from Postman API.\n"
-                    "This usually means:\n"
-                    "  • The endpoint returned no data or empty response\n"
-                    "  • Network connectivity issue\n"
-                    "  • The API endpoint might not exist\n"
-                    f"\nTried to access: {url}\n"
-                    "\n🔧 Troubleshooting:\n"
-                    "  • Run: python scripts/validate_setup.py\n"
-                    "  • Check Postman API status: https://status.postman.com/"
-                )
-                raise NetworkError(message=error_msg) from e
-            except Exception as e:
-                if isinstance(e, (NetworkError, TimeoutError)):
-                    raise
-                raise NetworkError(message=f"Request failed: {str(e)}", original_error=e) from e
+            send = self._send_curl
+            send_args = (curl_cmd, url, timeout, request_body)
 
         try:
-            # Use retry handler
-            response = self.retry_handler.execute(execute_curl)
-        except TimeoutError:
-            raise
-        except NetworkError:
+            # Use retry handler; concurrent identical GETs share one round trip
+            if method.upper() == 'GET':
+                response = self._send_once((url, tuple(extra_headers)), send, send_args)
+            else:
+                response = self.retry_handler.execute(send, *send_args)
+        except PostmanAPIError:
+            # Includes TimeoutError/NetworkError and exhausted 429/5xx retries
             raise
         except Exception as e:
             raise NetworkError(
@@ -277,9 +459,266 @@ class PostmanClient:
         if response.status_code >= 400:
             raise create_exception_from_response(response)
 
+        if use_cache:
+            if response.status_code == 304 and cached:
+                self.cache.refresh(self._cache_scope, endpoint, cache_ttl)
+                return jsonlib.loads(cached['body']) if cached['body'] else {}
+            lifetime = _cache_lifetime(response.headers, cache_ttl)
+            if lifetime is not None:
+                self.cache.set(
+                    self._cache_scope, endpoint,
+                    response._body.decode('utf-8', 'replace'), lifetime,
+                    etag=_get_header(response.headers, 'ETag'),
+                    last_modified=_get_header(response.headers, 'Last-Modified')
+                )
+        elif self.cache is not None and method.upper() != 'GET':
+            # Writes make cached reads of the same resource type stale,
+            # and workspace responses embed the resource lists
+            self.invalidate_cache(endpoint)
+
         # Return parsed response
         return response.json()
 
+    @staticmethod
+    def _split_response(output):
+        """
+        Split raw curl -i output into header and body bytes.
+
+        Returns:
+            (headers, body) tuple, or (None, None) if no header terminator
+        """
+        sep = output.find(b'\r\n\r\n')
+        if sep != -1:
+            return output[:sep], output[sep + 4:]
+        sep = output.find(b'\n\n')
+        if sep != -1:
+            return output[:sep], output[sep + 2:]
+        return None, None
+
+    def _send_curl(self, curl_cmd, url, timeout, body=None):
+        """
+        Run a prepared curl command and parse its output.
+
+        This is the transport: everything above it (request building, retries,
+        caching, error mapping) is independent of how the bytes are moved.
+
+        Args:
+            curl_cmd: Full curl argument list, URL last
+            url: Request URL (for error messages)
+            timeout: Request timeout in seconds
+            body: Request body bytes fed to curl's stdin (for '--data-binary @-')
+
+        Returns:
+            Response object with status_code, headers and json()
+
+        Raises:
+            NetworkError: If curl fails or its output can't be parsed
+            TimeoutError: If the request times out
+        """
+        try:
+            # Debug: print curl command if POSTMAN_DEBUG is set
+            if self.debug:
+                print(f"DEBUG: Executing curl command: {' '.join(curl_cmd[:10])}... {url}", file=sys.stderr)
+                print(f"DEBUG: Using proxy: {os.environ.get('https_proxy', 'none')}", file=sys.stderr)
+
+            # Work in bytes end to end: the body goes straight from curl's
+            # stdout to the JSON parser without a decode/copy as text
+            result = subprocess.run(
+                curl_cmd,
+                input=body,
+                capture_output=True,
+                timeout=timeout + 5  # Add buffer to subprocess timeout
+                # env is inherited as-is - the proxy is configured correctly
+                # and removing it breaks DNS resolution
+            )
+
+            if result.returncode == _CURLE_OPERATION_TIMEDOUT:
+                raise TimeoutError(timeout_seconds=timeout)
+            if result.returncode != 0:
+                stderr = result.stderr.decode('utf-8', 'replace').strip()
+                stdout = result.stdout.decode('utf-8', 'replace').strip()
+                error_msg = stderr or stdout or "Unknown curl error"
+                raise NetworkError(
+                    message=f"Curl failed (exit code {result.returncode}): {error_msg}\n"
+                            f"Command: {' '.join(curl_cmd[:4])}... {url}"
+                )
+
+            # Parse response (headers + body)
+            output = result.stdout
+            if not output:
+                raise NetworkError(message="Empty response from curl")
+
+            headers_bytes, body = self._split_response(output)
+            if headers_bytes is None:
+                raise NetworkError(message="Invalid response format from curl")
+
+            # Skip interim responses (proxy CONNECT, 100 Continue) that curl
+            # prints ahead of the final one
+            while body.lstrip().startswith(b'HTTP/'):
+                nested_headers, nested_body = self._split_response(body.lstrip())
+                if nested_headers is None:
+                    break
+                headers_bytes, body = nested_headers, nested_body
+
+            # Header bytes are ISO-8859-1 per HTTP; decoding can't fail
+            headers_text = headers_bytes.decode('iso-8859-1')
+
+            # Debug: print response details if POSTMAN_DEBUG is set
+            if self.debug:
+                print(f"DEBUG: Headers (first 200 chars): {headers_text[:200]}", file=sys.stderr)
+                print(f"DEBUG: Response body length: {len(body)}", file=sys.stderr)
+                print(f"DEBUG: Response body (first 200 chars): {body[:200].decode('utf-8', 'replace')}", file=sys.stderr)
+
+            # Extract status code from headers
+            header_lines = headers_text.split('\n')
+            status_line = header_lines[0]
+            status_parts = status_line.split(None, 2)
+            if len(status_parts) < 2:
+                raise NetworkError(message=f"Invalid HTTP status line: {status_line}")
+            status_code = int(status_parts[1])
+
+            # Parse response headers
+            response_headers = {}
+            for line in header_lines[1:]:
+                key, sep, value = line.partition(':')
+                if sep:
+                    response_headers[key.strip()] = value.strip()
+
+            return _MockResponse(status_code, response_headers, body)
+
+        except subprocess.TimeoutExpired as e:
+            raise TimeoutError(timeout_seconds=timeout) from e
+        except jsonlib.JSONDecodeError as e:
+            # Better error for empty/invalid responses
+            error_msg = (
+                "Received invalid JSON response from Postman API.\n"
+                "This usually means:\n"
+                "  • The endpoint returned no data or empty response\n"
+                "  • Network connectivity issue\n"
+                "  • The API endpoint might not exist\n"
+                f"\nTried to access: {url}\n"
+                "\n🔧 Troubleshooting:\n"
+                "  • Run: python scripts/validate_setup.py\n"
+                "  • Check Postman API status: https://status.postman.com/"
+            )
+            raise NetworkError(message=error_msg) from e
+        except Exception as e:
+            if isinstance(e, (NetworkError, TimeoutError)):
+                raise
+            raise NetworkError(message=f"Request failed: {str(e)}", original_error=e) from e
+
+    def _send_pycurl(self, method, url, headers, timeout, body=None):
+        """
+        Execute a single request in-process through libcurl (pycurl).
+
+        Behaves like _send_curl: same TLS and proxy handling (libcurl reads
+        the *_proxy environment variables itself) and the same errors. Easy
+        handles are pooled and reset between requests; the shared connection
+        cache lets later requests skip the TCP/TLS setup.
+        """
+        with self._curl_lock:
+            handle = self._idle_curl_handles.pop() if self._idle_curl_handles else None
+        if handle is None:
+            handle = pycurl.Curl()
+            handle.setopt(pycurl.SHARE, self._curl_share)
+        else:
+            handle.reset()  # Keeps the share attachment
+
+        buffer = BytesIO()
+        response_headers = {}
+
+        def on_header(line):
+            line = line.decode('iso-8859-1')
+            if line.startswith('HTTP/'):
+                # Interim responses (100 Continue, proxy CONNECT) come first
+                response_headers.clear()
+                return
+            key, sep, value = line.partition(':')
+            if sep:
+                response_headers[key.strip()] = value.strip()
+
+        try:
+            handle.setopt(pycurl.URL, url)
+            handle.setopt(pycurl.SSL_VERIFYPEER, 0)
+            handle.setopt(pycurl.SSL_VERIFYHOST, 0)
+            handle.setopt(pycurl.HTTPHEADER, headers)
+            handle.setopt(pycurl.TIMEOUT_MS, int(timeout * 1000))
+            handle.setopt(pycurl.NOSIGNAL, 1)
+            if _PYCURL_HTTP_VERSION is not None:
+                handle.setopt(pycurl.HTTP_VERSION, _PYCURL_HTTP_VERSION)
+            if method != 'GET':
+                handle.setopt(pycurl.CUSTOMREQUEST, method)
+            if body is not None:
+                handle.setopt(pycurl.POSTFIELDS, body)
+            handle.setopt(pycurl.WRITEDATA, buffer)
+            handle.setopt(pycurl.HEADERFUNCTION, on_header)
+
+            if self.debug:
+                print(f"DEBUG: Executing {method} {url} via pycurl", file=sys.stderr)
+
+            try:
+                handle.perform()
+            except pycurl.error as e:
+                code, error_msg = e.args[0], e.args[1] if len(e.args) > 1 else ""
+                if code == _CURLE_OPERATION_TIMEDOUT:
+                    raise TimeoutError(timeout_seconds=timeout) from e
+                raise NetworkError(
+                    message=f"Curl failed (exit code {code}): {error_msg or 'Unknown curl error'}\n"
+                            f"Request: {method} {url}"
+                ) from e
+
+            status_code = handle.getinfo(pycurl.RESPONSE_CODE)
+        finally:
+            with self._curl_lock:
+                self._idle_curl_handles.append(handle)
+
+        body = buffer.getvalue()
+
+        if self.debug:
+            print(f"DEBUG: Response status: {status_code}, body length: {len(body)}", file=sys.stderr)
+
+        return _MockResponse(status_code, response_headers, body)
+
+    def gather(self, *calls):
+        """
+        Run independent client calls concurrently and collect their results.
+
+        Up to config.max_concurrency calls overlap their round trips, each on
+        its own thread (and curl process or pycurl handle). Keep the bound
+        modest: the Postman API rate-limits per key, and past ~10 concurrent
+        connections to a single host throughput stops improving.
+
+        Args:
+            *calls: Zero-argument callables, e.g. client.list_monitors or
+                functools.partial(client.get_monitor, monitor_id)
+
+        Returns:
+            List of results, in the same order as the calls
+
+        Raises:
+            The exception of the first failing call (in call order). Calls
+            that had not started when it failed are cancelled; calls already
+            in flight are allowed to finish.
+
+        Example:
+            >>> collections, environments = client.gather(
+            ...     client.list_collections, client.list_environments)
+        """
+        workers = min(self.config.max_concurrency or 8, len(calls))
+        if workers <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(call) for call in calls]
+            # On the first failure, drop the calls that haven't started yet
+            _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            return [future.result() for future in futures if not future.cancelled()]
+
+    def _fetch_all(self, fetch, ids, **kwargs):
+        """Call `fetch(id, **kwargs)` for each ID via gather(), preserving order."""
+        return self.gather(*(functools.partial(fetch, item_id, **kwargs) for item_id in ids))
+
     def list_collections(self, workspace_id=None):
         """
         List all collections in a workspace.
@@ -292,16 +731,13 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/collections?workspace={workspace_id}"
-        else:
-            endpoint = "/collections"
+        endpoint = "/collections"
 
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'workspace': workspace_id}, cache_ttl=self.config.cache_ttl)
         collections = response.get('collections', [])
 
         # Provide helpful context for empty results (only in debug mode)
-        if len(collections) == 0 and os.getenv('POSTMAN_DEBUG'):
+        if len(collections) == 0 and self.debug:
             if workspace_id:
                 import sys
                 print(f"ℹ️  No collections found in workspace {workspace_id}", file=sys.stderr)
@@ -320,9 +756,21 @@ class PostmanClient:
             Collection object with full details
         """
         endpoint = f"/collections/{collection_uid}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.config.cache_ttl)
         return response.get('collection', {})
 
+    def get_collections_bulk(self, collection_uids):
+        """
+        Get full details for several collections in parallel.
+
+        Args:
+            collection_uids: Iterable of collection UIDs
+
+        Returns:
+            List of collection objects, in the same order as the UIDs
+        """
+        return self._fetch_all(self.get_collection, collection_uids)
+
     def create_collection(self, collection_data, workspace_id=None):
         """
         Create a new collection.
@@ -339,12 +787,9 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/collections?workspace={workspace_id}"
-        else:
-            endpoint = "/collections"
+        endpoint = "/collections"
 
-        response = self._make_request('POST', endpoint, json={'collection': collection_data})
+        response = self._make_request('POST', endpoint, params={'workspace': workspace_id}, json={'collection': collection_data})
         return response.get('collection', {})
 
     def update_collection(self, collection_uid, collection_data):
@@ -475,10 +920,7 @@ class PostmanClient:
         """
         endpoint = f"/collections/{collection_uid}/pull-requests"
 
-        if status:
-            endpoint += f"?status={status}"
-
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'status': status})
         return response.get('pull_requests', [])
 
     def merge_pull_request(self, collection_uid, pull_request_id):
@@ -503,7 +945,7 @@ class PostmanClient:
         response = self._make_request('POST', endpoint)
         return response.get('pull_request', {})
 
-    def duplicate_collection(self, collection_uid, name=None, workspace_id=None):
+    def duplicate_collection(self, collection_uid, name=None, workspace_id=None, source=None):
         """
         Duplicate a collection (create a copy, not a fork).
 
@@ -514,6 +956,8 @@ class PostmanClient:
             collection_uid: Collection UID to duplicate
             name: Name for the duplicate (defaults to original name + " Copy")
             workspace_id: Workspace for duplicate (uses config default if not provided)
+            source: Already-fetched collection object to copy, saving the GET
+                (not modified)
 
         Returns:
             Duplicated collection object
@@ -525,10 +969,11 @@ class PostmanClient:
             ... )
         """
         # Get original collection
-        original = self.get_collection(collection_uid)
+        original = source if source is not None else self.get_collection(collection_uid)
 
-        # Prepare new collection data
+        # Prepare new collection data (info is copied too, since it is edited below)
         new_collection = original.copy()
+        new_collection['info'] = dict(original.get('info') or {})
 
         # Set new name
         if name:
@@ -558,12 +1003,9 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/environments?workspace={workspace_id}"
-        else:
-            endpoint = "/environments"
+        endpoint = "/environments"
 
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'workspace': workspace_id}, cache_ttl=self.config.cache_ttl)
         return response.get('environments', [])
 
     def get_environment(self, environment_uid):
@@ -577,9 +1019,21 @@ class PostmanClient:
             Environment object with full details
         """
         endpoint = f"/environments/{environment_uid}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.config.cache_ttl)
         return response.get('environment', {})
 
+    def get_environments_bulk(self, environment_uids):
+        """
+        Get full details for several environments in parallel.
+
+        Args:
+            environment_uids: Iterable of environment UIDs
+
+        Returns:
+            List of environment objects, in the same order as the UIDs
+        """
+        return self._fetch_all(self.get_environment, environment_uids)
+
     def create_environment(self, name, values=None, workspace_id=None):
         """
         Create a new environment with automatic secret detection.
@@ -618,8 +1072,6 @@ class PostmanClient:
         workspace_id = workspace_id or self.config.workspace_id
 
         endpoint = "/environments"
-        if workspace_id:
-            endpoint += f"?workspace={workspace_id}"
 
         # Format variables
         variables = []
@@ -650,7 +1102,7 @@ class PostmanClient:
             }
         }
 
-        response = self._make_request('POST', endpoint, json=payload)
+        response = self._make_request('POST', endpoint, params={'workspace': workspace_id}, json=payload)
         return response.get('environment', {})
 
     def _detect_secret_type(self, key):
@@ -663,18 +1115,7 @@ class PostmanClient:
         Returns:
             'secret' if the variable appears sensitive, 'default' otherwise
         """
-        sensitive_keywords = [
-            'key', 'token', 'secret', 'password', 'passwd',
-            'pwd', 'auth', 'credential', 'private', 'apikey',
-            'api_key', 'bearer', 'authorization'
-        ]
-
-        key_lower = key.lower()
-        for keyword in sensitive_keywords:
-            if keyword in key_lower:
-                return 'secret'
-
-        return 'default'
+        return _detect_secret_type(key)
 
     def update_environment(self, environment_uid, name=None, values=None):
         """
@@ -714,28 +1155,30 @@ class PostmanClient:
 
         # Update variables if provided
         if values:
-            current_vars = {v['key']: v for v in current.get('values', [])}
-
             if isinstance(values, dict):
-                # Update existing or add new variables
+                # Update existing or add new variables in place
+                current_values = current.get('values') or []
+                current['values'] = current_values
+                index = {v['key']: i for i, v in enumerate(current_values)}
+
                 for key, value in values.items():
-                    if key in current_vars:
+                    i = index.get(key)
+                    if i is not None:
                         # Update existing variable
-                        current_vars[key]['value'] = str(value)
+                        var = current_values[i]
+                        var['value'] = str(value)
                         # Preserve type unless it should be secret
-                        if current_vars[key].get('type') != 'secret':
-                            current_vars[key]['type'] = self._detect_secret_type(key)
+                        if var.get('type') != 'secret':
+                            var['type'] = self._detect_secret_type(key)
                     else:
                         # Add new variable
-                        var = {
+                        index[key] = len(current_values)
+                        current_values.append({
                             'key': key,
                             'value': str(value),
                             'type': self._detect_secret_type(key),
                             'enabled': True
-                        }
-                        current_vars[key] = var
-
-                current['values'] = list(current_vars.values())
+                        })
 
             elif isinstance(values, list):
                 # Replace all variables
@@ -764,7 +1207,7 @@ class PostmanClient:
         response = self._make_request('DELETE', endpoint)
         return response
 
-    def duplicate_environment(self, environment_uid, name=None, workspace_id=None):
+    def duplicate_environment(self, environment_uid, name=None, workspace_id=None, source=None):
         """
         Duplicate an environment.
 
@@ -775,6 +1218,7 @@ class PostmanClient:
             environment_uid: Environment UID to duplicate
             name: Name for the duplicate (defaults to original name + " Copy")
             workspace_id: Workspace for duplicate (uses config default if not provided)
+            source: Already-fetched environment object to copy, saving the GET
 
         Returns:
             Duplicated environment object
@@ -786,7 +1230,7 @@ class PostmanClient:
             ... )
         """
         # Get original environment
-        original = self.get_environment(environment_uid)
+        original = source if source is not None else self.get_environment(environment_uid)
 
         # Prepare new environment name
         new_name = name or f"{original['name']} Copy"
@@ -831,12 +1275,9 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/monitors?workspace={workspace_id}"
-        else:
-            endpoint = "/monitors"
+        endpoint = "/monitors"
 
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'workspace': workspace_id}, cache_ttl=self.list_cache_ttl)
         return response.get('monitors', [])
 
     def get_monitor(self, monitor_id):
@@ -850,7 +1291,7 @@ class PostmanClient:
             Monitor object with full details
         """
         endpoint = f"/monitors/{monitor_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl)
         return response.get('monitor', {})
 
     def create_monitor(self, monitor_data):
@@ -911,10 +1352,23 @@ class PostmanClient:
         Returns:
             List of monitor run objects
         """
-        endpoint = f"/monitors/{monitor_id}/runs?limit={limit}"
-        response = self._make_request('GET', endpoint)
+        endpoint = f"/monitors/{monitor_id}/runs"
+        response = self._make_request('GET', endpoint, params={'limit': limit})
         return response.get('runs', [])
 
+    def get_monitor_runs_bulk(self, monitor_ids, limit=10):
+        """
+        Get run history for several monitors in parallel.
+
+        Args:
+            monitor_ids: Iterable of monitor IDs
+            limit: Number of runs to retrieve per monitor (default: 10)
+
+        Returns:
+            List of run lists, in the same order as the IDs
+        """
+        return self._fetch_all(self.get_monitor_runs, monitor_ids, limit=limit)
+
     def list_apis(self, workspace_id=None):
         """
         List all APIs in a workspace.
@@ -927,12 +1381,9 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/apis?workspace={workspace_id}"
-        else:
-            endpoint = "/apis"
+        endpoint = "/apis"
 
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'workspace': workspace_id}, cache_ttl=self.list_cache_ttl)
         return response.get('apis', [])
 
     def get_workspace(self, workspace_id=None):
@@ -951,7 +1402,7 @@ class PostmanClient:
             raise ValueError("Workspace ID must be provided or set in configuration")
 
         endpoint = f"/workspaces/{workspace_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.list_cache_ttl)
         return response.get('workspace', {})
 
     # Design Phase: Schema and API Operations
@@ -967,7 +1418,7 @@ class PostmanClient:
             API object with full details
         """
         endpoint = f"/apis/{api_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl)
         return response.get('api', {})
 
     def get_api_versions(self, api_id):
@@ -981,7 +1432,7 @@ class PostmanClient:
             List of API version objects
         """
         endpoint = f"/apis/{api_id}/versions"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.list_cache_ttl)
         return response.get('versions', [])
 
     def get_api_version(self, api_id, version_id):
@@ -996,7 +1447,7 @@ class PostmanClient:
             API version object with details
         """
         endpoint = f"/apis/{api_id}/versions/{version_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl)
         return response.get('version', {})
 
     def get_api_schema(self, api_id, version_id):
@@ -1011,9 +1462,25 @@ class PostmanClient:
             Schema object
         """
         endpoint = f"/apis/{api_id}/versions/{version_id}/schemas"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl)
         return response.get('schemas', [])
 
+    def get_all_api_schemas(self, api_id):
+        """
+        Get the schemas of every version of an API.
+
+        Lists the versions, then fetches their schemas in parallel.
+
+        Args:
+            api_id: Unique identifier for the API
+
+        Returns:
+            Dict mapping version ID to its schema list, in version order
+        """
+        version_ids = [v['id'] for v in self.get_api_versions(api_id) if v.get('id')]
+        schemas = self._fetch_all(functools.partial(self.get_api_schema, api_id), version_ids)
+        return dict(zip(version_ids, schemas))
+
     def create_api(self, api_data, workspace_id=None):
         """
         Create a new API.
@@ -1039,23 +1506,22 @@ class PostmanClient:
         Returns:
             Created API object
         """
-        # Warn users about deprecation
-        warnings.warn(
-            "create_api() is deprecated and will be removed in a future version. "
-            "Please use create_spec() to create specifications in Postman's Spec Hub instead. "
-            "See: https://learning.postman.com/docs/design-apis/specifications/overview/",
-            DeprecationWarning,
-            stacklevel=2
-        )
+        # Warn users about deprecation (once per process, not per call)
+        if not PostmanClient._create_api_warned:
+            warnings.warn(
+                "create_api() is deprecated and will be removed in a future version. "
+                "Please use create_spec() to create specifications in Postman's Spec Hub instead. "
+                "See: https://learning.postman.com/docs/design-apis/specifications/overview/",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            PostmanClient._create_api_warned = True
 
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/apis?workspace={workspace_id}"
-        else:
-            endpoint = "/apis"
+        endpoint = "/apis"
 
-        response = self._make_request('POST', endpoint, json={'api': api_data})
+        response = self._make_request('POST', endpoint, params={'workspace': workspace_id}, json={'api': api_data})
         return response.get('api', {})
 
     def update_api(self, api_id, api_data):
@@ -1139,7 +1605,7 @@ class PostmanClient:
         if not workspace_id:
             raise ValueError("workspace_id is required to create a spec. Set POSTMAN_WORKSPACE_ID in .env or pass workspace_id parameter.")
 
-        endpoint = f"/specs?workspaceId={workspace_id}"
+        endpoint = "/specs"
 
         # Build the request payload
         payload = {
@@ -1164,7 +1630,7 @@ class PostmanClient:
             # Note: root is handled automatically by API based on type field
             payload["files"].append(file_entry)
 
-        response = self._make_request('POST', endpoint, json=payload)
+        response = self._make_request('POST', endpoint, params={'workspaceId': workspace_id}, json=payload)
         return response.get('data', {})
 
     def list_specs(self, workspace_id=None, limit=10, offset=0):
@@ -1187,27 +1653,51 @@ class PostmanClient:
         workspace_id = workspace_id or self.config.workspace_id
 
         endpoint = "/specs"
-        params = []
 
-        if workspace_id:
-            params.append(f"workspaceId={workspace_id}")
-        if limit:
-            params.append(f"limit={limit}")
-        if offset:
-            params.append(f"offset={offset}")
+        params = {'workspaceId': workspace_id, 'limit': limit, 'offset': offset}
+        response = self._make_request('GET', endpoint, params=params, cache_ttl=self.list_cache_ttl)
+        return response.get('data', [])
 
-        if params:
-            endpoint += "?" + "&".join(params)
+    def iter_specs(self, workspace_id=None, page_size=100):
+        """
+        Iterate over every API specification in a workspace, page by page.
 
-        response = self._make_request('GET', endpoint)
-        return response.get('data', [])
+        The next page is requested in the background while the caller works
+        through the current one, so page boundaries rarely wait on the network.
+
+        Args:
+            workspace_id: Workspace ID (uses config default if not provided)
+            page_size: Number of specs requested per page (default: 100)
+
+        Yields:
+            Spec objects, in the order the API returns them
 
-    def get_spec(self, spec_id):
+        Example:
+            >>> for spec in client.iter_specs():
+            ...     print(f"{spec['name']} - {spec['id']}")
+        """
+        workspace_id = workspace_id or self.config.workspace_id
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            offset = 0
+            page = self.list_specs(workspace_id, page_size, offset)
+            while page:
+                # A short page is the last one; don't ask for another
+                upcoming = None
+                if len(page) >= page_size:
+                    offset += page_size
+                    upcoming = pool.submit(self.list_specs, workspace_id, page_size, offset)
+                yield from page
+                page = upcoming.result() if upcoming else None
+
+    def get_spec(self, spec_id, use_cache=True):
         """
         Get detailed information about a specific API specification.
 
         Args:
             spec_id: Unique identifier for the spec
+            use_cache: Set to False to always ask the API (e.g. to check the
+                spec still exists)
 
         Returns:
             Spec object with full details including files
@@ -1218,7 +1708,7 @@ class PostmanClient:
             >>> print(f"Files: {len(spec.get('files', []))}")
         """
         endpoint = f"/specs/{spec_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl if use_cache else None)
         return response.get('data', {})
 
     def update_spec(self, spec_id, spec_data):
@@ -1295,6 +1785,33 @@ class PostmanClient:
         response = self._make_request('POST', endpoint, json=payload)
         return response.get('data', {})
 
+    def create_spec_files_bulk(self, spec_id, files):
+        """
+        Add several files to an existing specification in parallel.
+
+        The API has no batch endpoint for adding files, so the POSTs are
+        issued concurrently (up to config.max_concurrency at a time).
+
+        Args:
+            spec_id: Unique identifier for the spec
+            files: List of file objects, as for create_spec():
+                - path: File path (e.g., "schemas/pet.json")
+                - content: File content as string (JSON or YAML)
+                - root: Boolean, mark as root file (optional)
+
+        Returns:
+            List of created file objects, in the same order as `files`
+
+        Raises:
+            The first error in `files` order; files before and after it may
+            still have been created
+        """
+        return self.gather(*(
+            functools.partial(self.create_spec_file, spec_id, f['path'], f['content'],
+                              root=f.get('root', False))
+            for f in files
+        ))
+
     def update_spec_file(self, spec_id, file_path, content=None, root=None):
         """
         Update an existing file in a specification.
@@ -1325,7 +1842,8 @@ class PostmanClient:
             ...     root=True
             ... )
         """
-        endpoint = f"/specs/{spec_id}/files/{file_path}"
+        # The file path is a single path parameter: "schemas/pet.json" -> "schemas%2Fpet.json"
+        endpoint = f"/specs/{spec_id}/files/{quote(file_path, safe='')}"
         payload = {}
 
         if content is not None:
@@ -1355,10 +1873,34 @@ class PostmanClient:
         Example:
             >>> client.delete_spec_file("spec-12345", "schemas/deprecated.json")
         """
-        endpoint = f"/specs/{spec_id}/files/{file_path}"
+        # The file path is a single path parameter: "schemas/pet.json" -> "schemas%2Fpet.json"
+        endpoint = f"/specs/{spec_id}/files/{quote(file_path, safe='')}"
         response = self._make_request('DELETE', endpoint)
         return response
 
+    def delete_spec_files_bulk(self, spec_id, file_paths):
+        """
+        Delete several files from a specification in parallel.
+
+        The DELETEs are issued concurrently (up to config.max_concurrency at a
+        time). If one fails, deletes that have not started yet are skipped.
+
+        Args:
+            spec_id: Unique identifier for the spec
+            file_paths: Paths of the files to delete
+
+        Returns:
+            List of deletion confirmations, in the same order as `file_paths`
+
+        Raises:
+            The first error in `file_paths` order; some of the other files
+            may already have been deleted
+
+        Example:
+            >>> client.delete_spec_files_bulk("spec-12345", ["schemas/old.json", "schemas/legacy.json"])
+        """
+        return self._fetch_all(functools.partial(self.delete_spec_file, spec_id), file_paths)
+
     def get_spec_files(self, spec_id):
         """
         List all files in a specification.
@@ -1375,9 +1917,21 @@ class PostmanClient:
             ...     print(f"{'[ROOT] ' if file.get('root') else ''}{file['path']}")
         """
         endpoint = f"/specs/{spec_id}/files"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.list_cache_ttl)
         return response.get('data', [])
 
+    def get_spec_files_bulk(self, spec_ids):
+        """
+        List the files of several specifications in parallel.
+
+        Args:
+            spec_ids: Iterable of spec IDs
+
+        Returns:
+            List of file lists, in the same order as the IDs
+        """
+        return self._fetch_all(self.get_spec_files, spec_ids)
+
     def generate_collection_from_spec(self, spec_id, collection_name=None):
         """
         Generate a Postman collection from an API specification.
@@ -1405,6 +1959,8 @@ class PostmanClient:
             payload["name"] = collection_name
 
         response = self._make_request('POST', endpoint, json=payload if payload else None)
+        # The write lands under /specs but adds a collection
+        self.invalidate_cache('/collections')
         return response
 
     def list_collections_from_spec(self, spec_id):
@@ -1456,6 +2012,8 @@ class PostmanClient:
             payload["workspace"] = workspace_id
 
         response = self._make_request('POST', endpoint, json=payload if payload else None)
+        # The write lands under /collections but adds a spec
+        self.invalidate_cache('/specs')
         return response
 
     # Deploy Phase: Mock Server Operations
@@ -1472,12 +2030,9 @@ class PostmanClient:
         """
         workspace_id = workspace_id or self.config.workspace_id
 
-        if workspace_id:
-            endpoint = f"/mocks?workspace={workspace_id}"
-        else:
-            endpoint = "/mocks"
+        endpoint = "/mocks"
 
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, params={'workspace': workspace_id}, cache_ttl=self.list_cache_ttl)
         return response.get('mocks', [])
 
     def get_mock(self, mock_id):
@@ -1491,7 +2046,7 @@ class PostmanClient:
             Mock server object with full details
         """
         endpoint = f"/mocks/{mock_id}"
-        response = self._make_request('GET', endpoint)
+        response = self._make_request('GET', endpoint, cache_ttl=self.item_cache_ttl)
         return response.get('mock', {})
 
     def create_mock(self, mock_data):
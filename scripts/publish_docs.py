@@ -16,15 +16,20 @@ Usage:
 import sys
 import os
 import argparse
-import json
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from functools import partial
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.postman_client import PostmanClient
 from scripts.config import PostmanConfig
+from utils import jsonlib
+from utils.response_cache import cli_cache
+
+# OpenAPI path-item keys counted as operations in the version summary
+_HTTP_METHODS = frozenset(('get', 'post', 'put', 'delete', 'patch'))
 
 
 def publish_collection_docs(client, collection_id, name=None):
@@ -42,38 +47,43 @@ def publish_collection_docs(client, collection_id, name=None):
         collection = client.get_collection(collection_id)
         collection_name = collection.get('info', {}).get('name', 'Unnamed Collection')
 
-        print(f"Collection: {collection_name}")
-        print(f"ID: {collection_id}\n")
+        output = []
+        output.append(f"Collection: {collection_name}")
+        output.append(f"ID: {collection_id}\n")
 
         # Generate public documentation URL
         # Note: Actual publishing may require Postman UI or specific API endpoints
         public_url = f"https://documenter.getpostman.com/view/{collection_id}"
 
-        print("✓ Collection can be accessed for documentation\n")
-        print("📚 Documentation URL:")
-        print(f"   {public_url}\n")
+        output.append("✓ Collection can be accessed for documentation\n")
+        output.append("📚 Documentation URL:")
+        output.append(f"   {public_url}\n")
 
-        print("📋 Collection Details:")
-        print(f"   Name: {collection_name}")
-        print(f"   Description: {collection.get('info', {}).get('description', 'No description')}")
+        output.append("📋 Collection Details:")
+        output.append(f"   Name: {collection_name}")
+        output.append(f"   Description: {collection.get('info', {}).get('description', 'No description')}")
 
-        # Count requests
+        # Count requests in folders at any depth
         total_requests = 0
-        for item in collection.get('item', []):
+        stack = list(collection.get('item', []))
+        while stack:
+            item = stack.pop()
             if 'request' in item:
                 total_requests += 1
-            elif 'item' in item:
-                total_requests += len([i for i in item['item'] if 'request' in i])
+            else:
+                stack.extend(item.get('item', ()))
+
+        output.append(f"   Total Endpoints: {total_requests}\n")
 
-        print(f"   Total Endpoints: {total_requests}\n")
+        output.append("💡 Next Steps:")
+        output.append("   1. Share the documentation URL with your team")
+        output.append("   2. Customize documentation in Postman web UI")
+        output.append("   3. Add examples and descriptions to requests")
+        output.append("   4. Set up environment templates for testing\n")
 
-        print("💡 Next Steps:")
-        print("   1. Share the documentation URL with your team")
-        print("   2. Customize documentation in Postman web UI")
-        print("   3. Add examples and descriptions to requests")
-        print("   4. Set up environment templates for testing\n")
+        output.append(f"🔗 View in Postman: https://postman.postman.co/collections/{collection_id}")
 
-        print(f"🔗 View in Postman: https://postman.postman.co/collections/{collection_id}")
+        print("\n".join(output))
 
     except Exception as e:
         print(f"Error publishing documentation: {e}")
@@ -88,69 +98,71 @@ def get_collection_status(client, collection_id):
         collection = client.get_collection(collection_id)
         collection_name = collection.get('info', {}).get('name', 'Unnamed Collection')
 
-        print(f"Collection: {collection_name}")
-        print(f"ID: {collection_id}\n")
+        output = []
+        output.append(f"Collection: {collection_name}")
+        output.append(f"ID: {collection_id}\n")
 
-        # Count documentation metrics
+        # Count documentation metrics. Folders can nest arbitrarily deep, so
+        # walk the tree with an explicit stack rather than recursion.
         total_requests = 0
         documented_requests = 0
         requests_with_examples = 0
 
-        def count_requests(items):
-            """Recursively count requests and their documentation."""
-            nonlocal total_requests, documented_requests, requests_with_examples
-
-            for item in items:
-                if 'request' in item:
-                    total_requests += 1
+        stack = list(collection.get('item', []))
+        while stack:
+            item = stack.pop()
+            request = item.get('request')
+            if request is not None:
+                total_requests += 1
 
-                    # Check if request has description
-                    if item.get('request', {}).get('description'):
-                        documented_requests += 1
+                # Check if request has description
+                if request.get('description'):
+                    documented_requests += 1
 
-                    # Check if request has example responses
-                    if item.get('response', []):
-                        requests_with_examples += 1
+                # Check if request has example responses
+                if item.get('response'):
+                    requests_with_examples += 1
 
-                elif 'item' in item:
-                    count_requests(item['item'])
-
-        count_requests(collection.get('item', []))
+            elif 'item' in item:
+                stack.extend(item['item'])
 
-        # Calculate documentation coverage
-        doc_coverage = (documented_requests / total_requests * 100) if total_requests > 0 else 0
-        example_coverage = (requests_with_examples / total_requests * 100) if total_requests > 0 else 0
+        # Calculate documentation coverage (percent per request, 0 if empty)
+        percent = 100.0 / total_requests if total_requests else 0.0
+        doc_coverage = documented_requests * percent
+        example_coverage = requests_with_examples * percent
 
-        print("📊 Documentation Metrics:")
-        print(f"   Total Endpoints: {total_requests}")
-        print(f"   Documented: {documented_requests} ({doc_coverage:.1f}%)")
-        print(f"   With Examples: {requests_with_examples} ({example_coverage:.1f}%)\n")
+        output.append("📊 Documentation Metrics:")
+        output.append(f"   Total Endpoints: {total_requests}")
+        output.append(f"   Documented: {documented_requests} ({doc_coverage:.1f}%)")
+        output.append(f"   With Examples: {requests_with_examples} ({example_coverage:.1f}%)\n")
 
         # Documentation quality score
         score = (doc_coverage + example_coverage) / 2
 
-        print(f"📈 Documentation Quality Score: {score:.1f}/100")
+        output.append(f"📈 Documentation Quality Score: {score:.1f}/100")
 
         if score >= 90:
-            print("   Grade: A (Excellent) ✅")
+            output.append("   Grade: A (Excellent) ✅")
         elif score >= 75:
-            print("   Grade: B (Good) ✔️")
+            output.append("   Grade: B (Good) ✔️")
         elif score >= 60:
-            print("   Grade: C (Fair) ⚠️")
+            output.append("   Grade: C (Fair) ⚠️")
         else:
-            print("   Grade: D (Needs Improvement) ❌")
+            output.append("   Grade: D (Needs Improvement) ❌")
 
-        print()
+        output.append("")
 
         # Recommendations
         if doc_coverage < 100:
-            print("💡 Recommendations:")
-            print(f"   • Add descriptions to {total_requests - documented_requests} endpoint(s)")
+            output.append("💡 Recommendations:")
+            output.append(f"   • Add descriptions to {total_requests - documented_requests} endpoint(s)")
 
         if example_coverage < 100:
             if doc_coverage >= 100:
-                print("💡 Recommendations:")
-            print(f"   • Add example responses to {total_requests - requests_with_examples} endpoint(s)")
+                output.append("💡 Recommendations:")
+            output.append(f"   • Add example responses to {total_requests - requests_with_examples} endpoint(s)")
+
+        print("\n".join(output))
 
     except Exception as e:
         print(f"Error getting collection status: {e}")
@@ -162,8 +174,7 @@ def compare_collections_for_changelog(client, old_id, new_id):
     print(f"=== Generating Changelog ===\n")
 
     try:
-        old_col = client.get_collection(old_id)
-        new_col = client.get_collection(new_id)
+        old_col, new_col = client.get_collections_bulk([old_id, new_id])
 
         old_name = old_col.get('info', {}).get('name', 'Old Version')
         new_name = new_col.get('info', {}).get('name', 'New Version')
@@ -177,32 +188,35 @@ def compare_collections_for_changelog(client, old_id, new_id):
             """Extract all requests from collection."""
             requests = {}
 
-            def extract(items, folder_path=""):
-                for item in items:
-                    if 'request' in item:
-                        name = item.get('name', 'Unnamed')
-                        path = f"{folder_path}/{name}" if folder_path else name
-                        method = item.get('request', {}).get('method', 'GET')
-                        url = item.get('request', {}).get('url', {})
-
-                        if isinstance(url, dict):
-                            url_str = url.get('raw', '')
-                        else:
-                            url_str = str(url)
-
-                        requests[path] = {
-                            'name': name,
-                            'method': method,
-                            'url': url_str,
-                            'description': item.get('request', {}).get('description', '')
-                        }
-
-                    elif 'item' in item:
-                        folder_name = item.get('name', 'Folder')
-                        new_path = f"{folder_path}/{folder_name}" if folder_path else folder_name
-                        extract(item['item'], new_path)
-
-            extract(collection.get('item', []))
+            # Depth-first with an explicit stack (children pushed in reverse)
+            # so entries keep the collection's order without recursing
+            stack = [(item, "") for item in reversed(collection.get('item', []))]
+            while stack:
+                item, folder_path = stack.pop()
+                request = item.get('request')
+                if request is not None:
+                    name = item.get('name', 'Unnamed')
+                    path = f"{folder_path}/{name}" if folder_path else name
+                    method = request.get('method', 'GET')
+                    url = request.get('url', {})
+
+                    if isinstance(url, dict):
+                        url_str = url.get('raw', '')
+                    else:
+                        url_str = str(url)
+
+                    requests[path] = {
+                        'name': name,
+                        'method': method,
+                        'url': url_str,
+                        'description': request.get('description', '')
+                    }
+
+                elif 'item' in item:
+                    folder_name = item.get('name', 'Folder')
+                    new_path = f"{folder_path}/{folder_name}" if folder_path else folder_name
+                    stack.extend((child, new_path) for child in reversed(item['item']))
+
             return requests
 
         old_requests = get_requests(old_col)
@@ -212,15 +226,22 @@ def compare_collections_for_changelog(client, old_id, new_id):
         added = {k: v for k, v in new_requests.items() if k not in old_requests}
         removed = {k: v for k, v in old_requests.items() if k not in new_requests}
         modified = {}
+        method_changed = []  # Keys of modified requests whose method changed
 
-        for key in set(old_requests.keys()) & set(new_requests.keys()):
-            old_req = old_requests[key]
-            new_req = new_requests[key]
+        # Walk the old requests in collection order; this also keeps the
+        # "Changed" section in a stable order between runs
+        for key, old_req in old_requests.items():
+            new_req = new_requests.get(key)
+            # Most requests are unchanged: one dict compare settles those
+            # before checking fields individually
+            if new_req is None or new_req == old_req:
+                continue
 
             changes = []
 
             if old_req['method'] != new_req['method']:
                 changes.append(f"Method: {old_req['method']} → {new_req['method']}")
+                method_changed.append(key)
 
             if old_req['url'] != new_req['url']:
                 changes.append(f"URL changed")
@@ -231,61 +252,63 @@ def compare_collections_for_changelog(client, old_id, new_id):
             if changes:
                 modified[key] = changes
 
-        # Print changelog
-        print("=" * 70)
-        print("# CHANGELOG")
-        print("=" * 70)
-        print()
+        # Render the changelog, then write it out in one go
+        output = []
+        output.append("=" * 70)
+        output.append("# CHANGELOG")
+        output.append("=" * 70)
+        output.append("")
 
-        print(f"## {new_name}")
-        print(f"*Released: {datetime.now().strftime('%Y-%m-%d')}*\n")
+        output.append(f"## {new_name}")
+        output.append(f"*Released: {datetime.now().strftime('%Y-%m-%d')}*\n")
 
         if added:
-            print(f"### ✨ Added ({len(added)} endpoint{'s' if len(added) > 1 else ''})")
-            print()
+            output.append(f"### ✨ Added ({len(added)} endpoint{'s' if len(added) > 1 else ''})")
+            output.append("")
             for name, req in added.items():
-                print(f"- **{req['method']}** `{name}`")
+                output.append(f"- **{req['method']}** `{name}`")
                 if req['description']:
-                    print(f"  - {req['description']}")
-            print()
+                    output.append(f"  - {req['description']}")
+            output.append("")
 
         if modified:
-            print(f"### 🔄 Changed ({len(modified)} endpoint{'s' if len(modified) > 1 else ''})")
-            print()
+            output.append(f"### 🔄 Changed ({len(modified)} endpoint{'s' if len(modified) > 1 else ''})")
+            output.append("")
             for name, changes in modified.items():
-                print(f"- `{name}`")
+                output.append(f"- `{name}`")
                 for change in changes:
-                    print(f"  - {change}")
-            print()
+                    output.append(f"  - {change}")
+            output.append("")
 
         if removed:
-            print(f"### ⚠️ Removed ({len(removed)} endpoint{'s' if len(removed) > 1 else ''})")
-            print()
+            output.append(f"### ⚠️ Removed ({len(removed)} endpoint{'s' if len(removed) > 1 else ''})")
+            output.append("")
             for name, req in removed.items():
-                print(f"- **{req['method']}** `{name}`")
-            print()
+                output.append(f"- **{req['method']}** `{name}`")
+            output.append("")
 
         # Breaking changes analysis
-        print("### 🔴 Breaking Changes")
-        print()
+        output.append("### 🔴 Breaking Changes")
+        output.append("")
 
         breaking_changes = []
 
         if removed:
             breaking_changes.append(f"{len(removed)} endpoint(s) removed")
 
-        for name, changes in modified.items():
-            if any('Method:' in c for c in changes):
-                breaking_changes.append(f"Method changed for {name}")
+        for name in method_changed:
+            breaking_changes.append(f"Method changed for {name}")
 
         if breaking_changes:
             for change in breaking_changes:
-                print(f"- {change}")
+                output.append(f"- {change}")
         else:
-            print("- None (Backward compatible)")
+            output.append("- None (Backward compatible)")
+
+        output.append("")
+        output.append("=" * 70)
 
-        print()
-        print("=" * 70)
+        print("\n".join(output))
 
     except Exception as e:
         print(f"Error generating changelog: {e}")
@@ -311,42 +334,65 @@ def generate_api_changelog(client, api_id):
         for i, version in enumerate(versions):
             print(f"  {i + 1}. {version.get('name', 'Unnamed')} (ID: {version.get('id')})")
 
-        print("\n" + "=" * 70)
-        print("# API VERSION HISTORY")
-        print("=" * 70)
-        print()
+        output = []
+        output.append("\n" + "=" * 70)
+        output.append("# API VERSION HISTORY")
+        output.append("=" * 70)
+        output.append("")
+
+        # Fetch every version's schema in parallel; a failed fetch only
+        # skips that version's summary
+        def fetch_schemas(version_id):
+            try:
+                return client.get_api_schema(api_id, version_id)
+            except Exception:
+                return None
+
+        all_schemas = client.gather(*(partial(fetch_schemas, v.get('id')) for v in versions))
 
-        for version in versions:
+        # Consecutive versions often share an identical schema; remember the
+        # last one so its summary is reused without parsing it again
+        previous_raw = previous_summary = None
+
+        for version, schemas in zip(versions, all_schemas):
             version_name = version.get('name', 'Unknown')
             created_at = version.get('createdAt', 'Unknown')
 
-            print(f"## Version {version_name}")
-            print(f"*Released: {created_at}*\n")
+            output.append(f"## Version {version_name}")
+            output.append(f"*Released: {created_at}*\n")
 
-            # Try to get schema
+            # Summarize the schema, if available
             try:
-                schemas = client.get_api_schema(api_id, version.get('id'))
                 if schemas:
-                    schema = json.loads(schemas[0].get('schema', '{}'))
-                    paths = schema.get('paths', {})
-
-                    print(f"### Summary")
-                    print(f"- Endpoints: {len(paths)}")
-
-                    # Count methods
-                    methods = defaultdict(int)
-                    for path, path_methods in paths.items():
-                        for method in path_methods.keys():
-                            if method in ['get', 'post', 'put', 'delete', 'patch']:
-                                methods[method.upper()] += 1
-
-                    print(f"- Methods: {dict(methods)}")
-                    print()
+                    raw = schemas[0].get('schema') or '{}'
+                    unchanged = previous_raw is not None and raw == previous_raw
+                    if unchanged:
+                        endpoints, methods = previous_summary
+                    else:
+                        paths = jsonlib.loads(raw).get('paths', {})
+                        endpoints = len(paths)
+
+                        # Count methods
+                        methods = Counter()
+                        for path_methods in paths.values():
+                            methods.update(m.upper() for m in path_methods if m in _HTTP_METHODS)
+                        previous_raw, previous_summary = raw, (endpoints, methods)
+
+                    output.append(f"### Summary")
+                    if unchanged:
+                        output.append("- Schema unchanged from the previous version")
+                    output.append(f"- Endpoints: {endpoints}")
+                    output.append(f"- Methods: {dict(methods)}")
+                    output.append("")
+                else:
+                    previous_raw = None
 
             except:
-                pass  # Skip if schema unavailable
+                previous_raw = None  # Skip if schema unavailable
+
+            output.append("")
 
-            print()
+        print("\n".join(output))
 
     except Exception as e:
         print(f"Error generating API changelog: {e}")
@@ -383,6 +429,8 @@ Examples:
     parser.add_argument('--new', metavar='COLLECTION_ID', help='New collection ID for comparison')
     parser.add_argument('--changelog', action='store_true', help='Generate API version changelog')
     parser.add_argument('--api', metavar='API_ID', help='API ID for changelog')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the response cache (~/.cache/postman-cli)')
 
     args = parser.parse_args()
 
@@ -390,8 +438,10 @@ Examples:
         parser.print_help()
         return
 
-    # Initialize client
-    client = PostmanClient()
+    # Initialize client. API version and schema responses are kept on disk
+    # so re-running --changelog revalidates them instead of re-downloading;
+    # collections hold secrets and stay in memory.
+    client = PostmanClient(cache=cli_cache(args.no_cache, persist=('apis',)))
 
     # Execute operations
     if args.publish:
@@ -19,14 +19,16 @@ import sys
 import os
 import argparse
 import subprocess
-import json
 import tempfile
+import threading
+from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.postman_client import PostmanClient
 from scripts.config import get_config
+from utils import jsonlib
 from utils.formatters import format_error
 
 
@@ -48,6 +50,24 @@ def check_newman_installed():
         return False, str(e)
 
 
+def _find_uid_by_name(items, name, kind):
+    """
+    Return the UID of the item whose name matches `name` case-insensitively.
+
+    Raises:
+        ValueError: If several items share the name, rather than silently
+            picking the first one
+    """
+    wanted = name.lower()
+    matches = [item['uid'] for item in items if item['name'].lower() == wanted]
+    if len(matches) > 1:
+        raise ValueError(
+            f"Several {kind}s are named '{name}' ({', '.join(matches)}); "
+            f"pass --{kind}-uid instead"
+        )
+    return matches[0] if matches else None
+
+
 def find_collection_by_name(client, name):
     """
     Find a collection UID by name.
@@ -59,30 +79,90 @@ def find_collection_by_name(client, name):
     Returns:
         Collection UID if found, None otherwise
     """
-    collections = client.list_collections()
-    for collection in collections:
-        if collection['name'].lower() == name.lower():
-            return collection['uid']
-    return None
+    return _find_uid_by_name(client.list_collections(), name, 'collection')
+
+
+# Reports above this size are read with a streaming parser when ijson's C
+# backend is available, keeping only the parts format_test_results() uses
+_STREAM_REPORT_THRESHOLD = 1024 * 1024
+
+
+def _load_report_streaming(fh, ijson):
+    """Collect run.stats, run.timings and run.failures without building the report."""
+    backend = ijson.get_backend('yajl2_c')
+    run = {'failures': []}
+    builder = target = None
+    for prefix, event, value in backend.parse(fh):
+        if builder is None:
+            if event not in ('start_map', 'start_array'):
+                continue
+            if prefix not in ('run.stats', 'run.timings', 'run.failures.item'):
+                continue
+            builder, target = ijson.ObjectBuilder(), prefix
+        builder.event(event, value)
+        if prefix == target and event in ('end_map', 'end_array'):
+            if target == 'run.failures.item':
+                run['failures'].append(builder.value)
+            else:
+                run[target[len('run.'):]] = builder.value
+            builder = None
+    return {'run': run}
 
 
-def run_newman(collection_file, environment_file=None, reporters='cli,json', timeout=300):
+def _load_report(report_path):
+    """Read a Newman JSON report; returns {} if Newman didn't write one."""
+    try:
+        size = os.path.getsize(report_path)
+    except OSError:
+        return {}
+    if size == 0:
+        return {}  # Newman exited before exporting
+
+    with open(report_path, 'rb') as f:
+        if size > _STREAM_REPORT_THRESHOLD:
+            try:
+                import ijson
+                return _load_report_streaming(f, ijson)
+            except ImportError:
+                pass  # ijson or its C backend not installed; parse normally
+        return jsonlib.loads(f.read())
+
+
+def _pump(stream, lines, echo=None):
+    """Read a pipe line by line into `lines`, copying each line to `echo`."""
+    for line in stream:
+        lines.append(line)
+        if echo is not None:
+            echo.write(line)
+            echo.flush()
+    stream.close()
+
+
+def run_newman(collection_file, environment_file=None, reporters='cli,json', timeout=300,
+               echo=True):
     """
     Execute Newman with the given collection and environment.
 
+    The JSON report goes to a private temporary file, so concurrent runs
+    never read each other's (or a previous run's) results.
+
     Args:
         collection_file: Path to collection JSON file
         environment_file: Optional path to environment JSON file
         reporters: Newman reporters to use (default: 'cli,json')
         timeout: Maximum execution time in seconds
+        echo: Copy Newman's console output to stdout as it runs (default: True)
 
     Returns:
-        tuple: (success: bool, results: dict)
+        tuple: (success: bool, results: dict, stdout: str, stderr: str)
     """
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        report_path = f.name
+
     cmd = [
         'newman', 'run', collection_file,
         '--reporters', reporters,
-        '--reporter-json-export', '/tmp/newman-results.json',
+        '--reporter-json-export', report_path,
         '--color', 'off',  # Disable colors for easier parsing
         '--disable-unicode'  # Disable unicode for compatibility
     ]
@@ -90,26 +170,50 @@ def run_newman(collection_file, environment_file=None, reporters='cli,json', tim
     if environment_file:
         cmd.extend(['--environment', environment_file])
 
+    proc = None
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=timeout
+            bufsize=1
         )
 
+        # Drain both pipes on threads so a chatty Newman never blocks on a
+        # full pipe, and so the timeout below still applies
+        stdout_lines, stderr_lines = [], []
+        readers = [
+            threading.Thread(target=_pump, args=(proc.stdout, stdout_lines,
+                                                 sys.stdout if echo else None)),
+            threading.Thread(target=_pump, args=(proc.stderr, stderr_lines)),
+        ]
+        for reader in readers:
+            reader.daemon = True
+            reader.start()
+
+        returncode = proc.wait(timeout=timeout)
+        for reader in readers:
+            reader.join()
+
         # Load JSON results if available
-        results = {}
-        if os.path.exists('/tmp/newman-results.json'):
-            with open('/tmp/newman-results.json', 'r') as f:
-                results = json.load(f)
+        results = _load_report(report_path)
 
-        return result.returncode == 0, results, result.stdout, result.stderr
+        return returncode == 0, results, ''.join(stdout_lines), ''.join(stderr_lines)
 
     except subprocess.TimeoutExpired:
         return False, {}, '', f'Newman execution timed out after {timeout} seconds'
     except Exception as e:
         return False, {}, '', str(e)
+    finally:
+        # Never leave Newman running (timeout, Ctrl-C, report errors)
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        try:
+            os.unlink(report_path)
+        except OSError:
+            pass
 
 
 def format_test_results(results):
@@ -236,64 +340,50 @@ def main():
         print("Downloading collection...")
         collection_data = client.get_collection(collection_uid)
 
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            collection_file = f.name
-            json.dump(collection_data, f)
-
-        # Handle environment if specified
-        environment_file = None
-        if args.environment or args.environment_uid:
-            print("Downloading environment...")
-
-            if args.environment:
-                # Find environment by name
-                environments = client.list_environments()
-                env_uid = None
-                for env in environments:
-                    if env['name'].lower() == args.environment.lower():
-                        env_uid = env['uid']
-                        break
-                if not env_uid:
-                    raise ValueError(f"Environment '{args.environment}' not found")
-            else:
-                env_uid = args.environment_uid
-
-            environment_data = client.get_environment(env_uid)
-
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                environment_file = f.name
-                json.dump(environment_data, f)
-
-        # Run Newman
-        print(f"\nRunning collection with Newman (timeout: {args.timeout}s)...")
-        print("-" * 60)
-
-        success, results, stdout, stderr = run_newman(
-            collection_file,
-            environment_file,
-            timeout=args.timeout
-        )
-
-        # Print Newman console output
-        if stdout:
-            print(stdout)
-
-        # Format and print results
-        if results:
-            print(format_test_results(results))
-
-        # Print any errors
-        if stderr:
-            print("\nNewman Errors:", file=sys.stderr)
-            print(stderr, file=sys.stderr)
-
-        # Cleanup
-        os.unlink(collection_file)
-        if environment_file:
-            os.unlink(environment_file)
-        if os.path.exists('/tmp/newman-results.json'):
-            os.unlink('/tmp/newman-results.json')
+        # Newman reads the collection and environment from files. They live in
+        # a private directory that is removed however the run ends.
+        with tempfile.TemporaryDirectory(prefix='newman-') as tmp:
+            work_dir = Path(tmp)
+
+            collection_file = work_dir / 'collection.json'
+            collection_file.write_bytes(jsonlib.dumpb(collection_data))
+
+            # Handle environment if specified
+            environment_file = None
+            if args.environment or args.environment_uid:
+                print("Downloading environment...")
+
+                if args.environment:
+                    # Find environment by name
+                    env_uid = _find_uid_by_name(client.list_environments(), args.environment, 'environment')
+                    if not env_uid:
+                        raise ValueError(f"Environment '{args.environment}' not found")
+                else:
+                    env_uid = args.environment_uid
+
+                environment_data = client.get_environment(env_uid)
+
+                environment_file = work_dir / 'environment.json'
+                environment_file.write_bytes(jsonlib.dumpb(environment_data))
+
+            # Run Newman
+            print(f"\nRunning collection with Newman (timeout: {args.timeout}s)...")
+            print("-" * 60)
+
+            success, results, stdout, stderr = run_newman(
+                str(collection_file),
+                str(environment_file) if environment_file else None,
+                timeout=args.timeout
+            )
+
+            # Format and print results
+            if results:
+                print(format_test_results(results))
+
+            # Print any errors
+            if stderr:
+                print("\nNewman Errors:", file=sys.stderr)
+                print(stderr, file=sys.stderr)
 
         sys.exit(0 if success else 1)
 
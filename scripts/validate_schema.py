@@ -18,21 +18,41 @@ Usage:
 import sys
 import os
 import argparse
-import json
 import re
-from collections import defaultdict
+from collections import Counter
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from scripts.postman_client import PostmanClient
 from scripts.config import PostmanConfig
+from utils import jsonlib
+
+# Matches "{name}" path template parameters, capturing the name
+_PATH_PARAM_RE = re.compile(r'\{([^}]+)\}')
+
+# Path-item keys that are operations, and the operations expected to carry a body
+_OPERATION_METHODS = frozenset(('get', 'post', 'put', 'delete', 'patch', 'head', 'options'))
+_BODY_METHODS = frozenset(('post', 'put', 'patch'))
+
+
+class _StopValidation(Exception):
+    """Raised by add_error() once the error budget is used up."""
 
 
 class SchemaValidator:
     """OpenAPI schema validator."""
 
-    def __init__(self):
+    def __init__(self, max_errors=None):
+        """
+        Args:
+            max_errors: Stop validating once this many errors are found, at
+                least 1 (None validates the whole spec)
+        """
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+        self.max_errors = max_errors
+        self.stopped_early = False
         self.errors = []
         self.warnings = []
         self.info = []
@@ -40,6 +60,8 @@ class SchemaValidator:
     def add_error(self, message, location=""):
         """Add a validation error."""
         self.errors.append({"location": location, "message": message})
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise _StopValidation
 
     def add_warning(self, message, location=""):
         """Add a validation warning."""
@@ -105,8 +127,8 @@ class SchemaValidator:
 
         print(f"✓ Found {len(paths)} path(s)")
 
-        # Track operations
-        operations_count = defaultdict(int)
+        # Track operations (counted once at the end)
+        operations_seen = []
 
         for path, methods in paths.items():
             # Check path format
@@ -114,14 +136,15 @@ class SchemaValidator:
                 self.add_error(f"Path must start with '/': {path}", f"paths.{path}")
 
             # Check for path parameters
-            path_params = re.findall(r'{([^}]+)}', path)
+            path_params = _PATH_PARAM_RE.findall(path)
+            location_prefix = f"paths.{path}."
 
             for method, operation in methods.items():
-                if method not in ['get', 'post', 'put', 'delete', 'patch', 'head', 'options']:
+                if method not in _OPERATION_METHODS:
                     continue
 
-                operations_count[method.upper()] += 1
-                location = f"paths.{path}.{method}"
+                operations_seen.append(method)
+                location = location_prefix + method
 
                 # Check for operationId
                 if 'operationId' not in operation:
@@ -148,7 +171,7 @@ class SchemaValidator:
                             )
 
                 # Check request body for POST/PUT/PATCH
-                if method in ['post', 'put', 'patch']:
+                if method in _BODY_METHODS:
                     if 'requestBody' not in operation:
                         self.add_warning(
                             f"{method.upper()} operation typically has a request body",
@@ -159,27 +182,22 @@ class SchemaValidator:
                 if 'responses' not in operation:
                     self.add_error(f"Missing responses", location)
                 else:
-                    responses = operation['responses']
+                    # First character of each status code, in one pass. str()
+                    # because YAML loads unquoted codes such as 200 as ints.
+                    status_classes = {str(code)[:1] for code in operation['responses']}
 
                     # Check for success response
-                    has_success = any(
-                        code.startswith('2') for code in responses.keys()
-                    )
-                    if not has_success:
+                    if '2' not in status_classes:
                         self.add_warning(f"No success response (2xx) defined", location)
 
                     # Check for error responses
-                    has_error = any(
-                        code.startswith('4') or code.startswith('5')
-                        for code in responses.keys()
-                    )
-                    if not has_error:
+                    if '4' not in status_classes and '5' not in status_classes:
                         self.add_info(f"Consider adding error responses (4xx, 5xx)", location)
 
         # Print operation summary
         print(f"\nOperation Summary:")
-        for method, count in sorted(operations_count.items()):
-            print(f"  {method}: {count}")
+        for method, count in sorted(Counter(operations_seen).items()):
+            print(f"  {method.upper()}: {count}")
 
     def validate_components(self, spec):
         """Validate components/schemas."""
@@ -198,9 +216,10 @@ class SchemaValidator:
 
             for schema_name, schema in schemas.items():
                 location = f"components.schemas.{schema_name}"
+                schema_type = schema.get('type')
 
                 # Check type
-                if 'type' not in schema and '$ref' not in schema:
+                if schema_type is None and '$ref' not in schema:
                     self.add_warning(f"Schema missing 'type' field", location)
 
                 # Check for description
@@ -208,7 +227,7 @@ class SchemaValidator:
                     self.add_info(f"Consider adding description", location)
 
                 # For object types, check properties
-                if schema.get('type') == 'object':
+                if schema_type == 'object':
                     if 'properties' not in schema:
                         self.add_warning(f"Object schema has no properties", location)
 
@@ -221,74 +240,86 @@ class SchemaValidator:
 
     def validate_spec(self, spec):
         """Run all validations."""
-        self.validate_openapi_structure(spec)
-        self.validate_paths(spec)
-        self.validate_components(spec)
+        try:
+            self.validate_openapi_structure(spec)
+            self.validate_paths(spec)
+            self.validate_components(spec)
+        except _StopValidation:
+            self.stopped_early = True
 
     def print_report(self):
         """Print validation report."""
-        print("\n" + "=" * 70)
-        print("📋 VALIDATION REPORT")
-        print("=" * 70 + "\n")
+        # Reports can list hundreds of findings; build the text, then print it once
+        output = []
+        output.append("\n" + "=" * 70)
+        output.append("📋 VALIDATION REPORT")
+        output.append("=" * 70 + "\n")
 
         total = len(self.errors) + len(self.warnings) + len(self.info)
 
         if total == 0:
-            print("✅ Schema is valid! No issues found.\n")
+            output.append("✅ Schema is valid! No issues found.\n")
+            print("\n".join(output))
             return
 
+        if self.stopped_early:
+            output.append(f"⏹️  Stopped after {len(self.errors)} error(s) (--max-errors); "
+                          "later checks were skipped\n")
+
         # Summary
-        print(f"Summary:")
-        print(f"  🔴 Errors: {len(self.errors)}")
-        print(f"  🟡 Warnings: {len(self.warnings)}")
-        print(f"  🔵 Info: {len(self.info)}")
-        print()
+        output.append(f"Summary:")
+        output.append(f"  🔴 Errors: {len(self.errors)}")
+        output.append(f"  🟡 Warnings: {len(self.warnings)}")
+        output.append(f"  🔵 Info: {len(self.info)}")
+        output.append("")
 
         # Errors
         if self.errors:
-            print("🔴 ERRORS (Must Fix):")
-            print("-" * 70)
+            output.append("🔴 ERRORS (Must Fix):")
+            output.append("-" * 70)
             for i, error in enumerate(self.errors, 1):
                 loc = f" [{error['location']}]" if error['location'] else ""
-                print(f"{i}. {error['message']}{loc}")
-            print()
+                output.append(f"{i}. {error['message']}{loc}")
+            output.append("")
 
         # Warnings
         if self.warnings:
-            print("🟡 WARNINGS (Should Fix):")
-            print("-" * 70)
+            output.append("🟡 WARNINGS (Should Fix):")
+            output.append("-" * 70)
             for i, warning in enumerate(self.warnings, 1):
                 loc = f" [{warning['location']}]" if warning['location'] else ""
-                print(f"{i}. {warning['message']}{loc}")
-            print()
+                output.append(f"{i}. {warning['message']}{loc}")
+            output.append("")
 
         # Info
         if self.info:
-            print("🔵 RECOMMENDATIONS:")
-            print("-" * 70)
+            output.append("🔵 RECOMMENDATIONS:")
+            output.append("-" * 70)
             for i, info in enumerate(self.info, 1):
                 loc = f" [{info['location']}]" if info['location'] else ""
-                print(f"{i}. {info['message']}{loc}")
-            print()
+                output.append(f"{i}. {info['message']}{loc}")
+            output.append("")
 
         # Score
         score = max(0, 100 - (len(self.errors) * 10) - (len(self.warnings) * 3))
-        print("=" * 70)
-        print(f"Validation Score: {score}/100")
+        output.append("=" * 70)
+        output.append(f"Validation Score: {score}/100")
 
         if score >= 90:
-            print("Grade: A (Excellent) ✅")
+            output.append("Grade: A (Excellent) ✅")
         elif score >= 75:
-            print("Grade: B (Good) ✔️")
+            output.append("Grade: B (Good) ✔️")
         elif score >= 60:
-            print("Grade: C (Fair) ⚠️")
+            output.append("Grade: C (Fair) ⚠️")
         else:
-            print("Grade: D (Needs Work) ❌")
+            output.append("Grade: D (Needs Work) ❌")
+
+        output.append("=" * 70 + "\n")
 
-        print("=" * 70 + "\n")
+        print("\n".join(output))
 
 
-def validate_from_api(client, api_id):
+def validate_from_api(client, api_id, max_errors=None):
     """Validate schema from Postman API."""
     print(f"=== Validating API: {api_id} ===\n")
 
@@ -312,11 +343,12 @@ def validate_from_api(client, api_id):
             print("❌ No schema found for this version")
             return
 
+        # The schema is normally JSON text, but may already be an object
         schema_content = schemas[0].get('schema', '{}')
-        spec = json.loads(schema_content)
+        spec = schema_content if isinstance(schema_content, dict) else jsonlib.loads(schema_content)
 
         # Validate
-        validator = SchemaValidator()
+        validator = SchemaValidator(max_errors=max_errors)
         validator.validate_spec(spec)
         validator.print_report()
 
@@ -325,7 +357,7 @@ def validate_from_api(client, api_id):
         sys.exit(1)
 
 
-def validate_from_spec(client, spec_id):
+def validate_from_spec(client, spec_id, max_errors=None):
     """Validate schema from Spec Hub."""
     print(f"=== Validating Spec: {spec_id} ===\n")
 
@@ -341,10 +373,10 @@ def validate_from_spec(client, spec_id):
         # Get root file
         root_file = next((f for f in files if f.get('root')), files[0])
         spec_content = root_file.get('content', '{}')
-        spec = json.loads(spec_content)
+        spec = spec_content if isinstance(spec_content, dict) else jsonlib.loads(spec_content)
 
         # Validate
-        validator = SchemaValidator()
+        validator = SchemaValidator(max_errors=max_errors)
         validator.validate_spec(spec)
         validator.print_report()
 
@@ -353,24 +385,26 @@ def validate_from_spec(client, spec_id):
         sys.exit(1)
 
 
-def validate_from_file(file_path):
+def validate_from_file(file_path, max_errors=None):
     """Validate schema from file."""
     print(f"=== Validating File: {file_path} ===\n")
 
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'rb') as f:
             if file_path.endswith('.yaml') or file_path.endswith('.yml'):
                 try:
                     import yaml
-                    spec = yaml.safe_load(f)
                 except ImportError:
                     print("❌ PyYAML not installed. Install with: pip install pyyaml")
                     sys.exit(1)
+                # The libyaml-backed loader is much faster when PyYAML has it
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                spec = yaml.load(f, Loader=loader)
             else:
-                spec = json.load(f)
+                spec = jsonlib.loads(f.read())
 
         # Validate
-        validator = SchemaValidator()
+        validator = SchemaValidator(max_errors=max_errors)
         validator.validate_spec(spec)
         validator.print_report()
 
@@ -379,6 +413,17 @@ def validate_from_file(file_path):
         sys.exit(1)
 
 
+def _positive_int(value):
+    """argparse type for counts that must be 1 or more."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
 
@@ -401,6 +446,8 @@ Examples:
     parser.add_argument('--api', metavar='API_ID', help='Validate API schema')
     parser.add_argument('--spec', metavar='SPEC_ID', help='Validate Spec Hub specification')
     parser.add_argument('--file', metavar='FILE_PATH', help='Validate local OpenAPI file')
+    parser.add_argument('--max-errors', type=_positive_int, metavar='N',
+                        help='Stop after N errors (useful in CI, where any error fails the build)')
 
     args = parser.parse_args()
 
@@ -411,17 +458,17 @@ Examples:
     # Execute validation
     if args.api:
         client = PostmanClient()
-        validate_from_api(client, args.api)
+        validate_from_api(client, args.api, args.max_errors)
 
     elif args.spec:
         client = PostmanClient()
-        validate_from_spec(client, args.spec)
+        validate_from_spec(client, args.spec, args.max_errors)
 
     elif args.file:
         if not os.path.exists(args.file):
             print(f"❌ File not found: {args.file}")
             sys.exit(1)
-        validate_from_file(args.file)
+        validate_from_file(args.file, args.max_errors)
 
 
 if __name__ == '__main__':
@@ -9,6 +9,7 @@ Usage:
 
 import sys
 import os
+from functools import partial
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -18,6 +19,16 @@ from scripts.config import PostmanConfig
 from utils.formatters import format_error
 
 
+def _none_on_error(call):
+    """Wrap a zero-argument call so that a failure returns None instead of raising."""
+    def wrapper():
+        try:
+            return call()
+        except Exception:
+            return None
+    return wrapper
+
+
 def validate_setup():
     """Comprehensive setup validation with helpful output."""
 
@@ -54,33 +65,37 @@ def validate_setup():
     if config.workspace_id:
         print(f"📁 Checking configured workspace: {config.workspace_id}")
         try:
-            workspace = client.get_workspace(config.workspace_id)
+            # The workspace lookup and the content counts are independent,
+            # so fetch them all at once
+            workspace_id = config.workspace_id
+            workspace, collections, environments, monitors, apis = client.gather(
+                partial(client.get_workspace, workspace_id),
+                partial(client.list_collections, workspace_id),
+                partial(client.list_environments, workspace_id),
+                _none_on_error(partial(client.list_monitors, workspace_id)),
+                _none_on_error(partial(client.list_apis, workspace_id)),
+            )
+
             workspace_name = workspace.get('name', 'Unknown')
             workspace_type = workspace.get('type', 'Unknown')
             print(f"✅ Workspace: {workspace_name} (Type: {workspace_type})\n")
 
             # 4. Get collection count
             print("📊 Analyzing workspace contents...")
-            collections = client.list_collections(config.workspace_id)
             collection_count = len(collections)
             print(f"   Collections: {collection_count}")
 
-            environments = client.list_environments(config.workspace_id)
             environment_count = len(environments)
             print(f"   Environments: {environment_count}")
 
-            try:
-                monitors = client.list_monitors(config.workspace_id)
-                monitor_count = len(monitors)
-                print(f"   Monitors: {monitor_count}")
-            except:
+            if monitors is not None:
+                print(f"   Monitors: {len(monitors)}")
+            else:
                 print(f"   Monitors: (unavailable)")
 
-            try:
-                apis = client.list_apis(config.workspace_id)
-                api_count = len(apis)
-                print(f"   APIs: {api_count}\n")
-            except:
+            if apis is not None:
+                print(f"   APIs: {len(apis)}\n")
+            else:
                 print(f"   APIs: (unavailable)\n")
 
             if collection_count == 0:
@@ -5,6 +5,8 @@ Provides specific exception types for different API error scenarios,
 with helpful error messages and resolution guidance.
 """
 
+import math
+
 
 class PostmanAPIError(Exception):
     """
@@ -16,6 +18,10 @@ class PostmanAPIError(Exception):
         response_data: Raw API response data (if available)
     """
 
+    # Store attributes in slots so no instance __dict__ is allocated;
+    # subclasses list only the attributes they add
+    __slots__ = ('message', 'status_code', 'response_data')
+
     def __init__(self, message, status_code=None, response_data=None):
         self.message = message
         self.status_code = status_code
@@ -35,6 +41,8 @@ class AuthenticationError(PostmanAPIError):
     Raised when authentication fails (401 Unauthorized).
     """
 
+    __slots__ = ()
+
     def __init__(self, message=None, status_code=401, response_data=None):
         if not message:
             message = (
@@ -60,6 +68,8 @@ class RateLimitError(PostmanAPIError):
         retry_after: Seconds to wait before retrying (from Retry-After header)
     """
 
+    __slots__ = ('retry_after',)
+
     def __init__(self, message=None, retry_after=None, status_code=429, response_data=None):
         self.retry_after = retry_after
 
@@ -89,6 +99,8 @@ class ResourceNotFoundError(PostmanAPIError):
     is not found (404 Not Found).
     """
 
+    __slots__ = ('resource_type', 'resource_id')
+
     def __init__(self, resource_type=None, resource_id=None, message=None,
                  status_code=404, response_data=None):
         self.resource_type = resource_type
@@ -118,6 +130,8 @@ class ValidationError(PostmanAPIError):
     Raised when the API request contains invalid data (400 Bad Request).
     """
 
+    __slots__ = ('validation_errors',)
+
     def __init__(self, message=None, validation_errors=None,
                  status_code=400, response_data=None):
         self.validation_errors = validation_errors or []
@@ -143,6 +157,8 @@ class PermissionError(PostmanAPIError):
     operation (403 Forbidden).
     """
 
+    __slots__ = ('required_permission',)
+
     def __init__(self, message=None, required_permission=None,
                  status_code=403, response_data=None):
         self.required_permission = required_permission
@@ -171,6 +187,8 @@ class DeprecatedEndpointError(PostmanAPIError):
     Raised when the skill detects use of a deprecated endpoint.
     """
 
+    __slots__ = ('endpoint', 'replacement')
+
     def __init__(self, endpoint, replacement=None, message=None,
                  status_code=None, response_data=None):
         self.endpoint = endpoint
@@ -198,6 +216,8 @@ class ConflictError(PostmanAPIError):
     For example, trying to create a resource that already exists.
     """
 
+    __slots__ = ()
+
     def __init__(self, message=None, status_code=409, response_data=None):
         if not message:
             message = (
@@ -218,6 +238,8 @@ class ServerError(PostmanAPIError):
     Raised when the Postman API returns a server error (5xx status codes).
     """
 
+    __slots__ = ()
+
     def __init__(self, message=None, status_code=500, response_data=None):
         if not message:
             message = (
@@ -238,6 +260,8 @@ class APIVersionError(PostmanAPIError):
     Raised when the detected API version doesn't support the requested feature.
     """
 
+    __slots__ = ('feature', 'required_version', 'detected_version')
+
     def __init__(self, feature, required_version=None, detected_version=None,
                  message=None):
         self.feature = feature
@@ -268,6 +292,8 @@ class NetworkError(PostmanAPIError):
     Raised when unable to connect to the Postman API due to network issues.
     """
 
+    __slots__ = ('original_error',)
+
     def __init__(self, message=None, original_error=None):
         self.original_error = original_error
 
@@ -332,6 +358,8 @@ class TimeoutError(PostmanAPIError):
     Raised when the API request times out.
     """
 
+    __slots__ = ('timeout_seconds',)
+
     def __init__(self, message=None, timeout_seconds=None):
         self.timeout_seconds = timeout_seconds
 
@@ -352,6 +380,31 @@ class TimeoutError(PostmanAPIError):
         super().__init__(message)
 
 
+def parse_retry_after(headers):
+    """
+    Read the Retry-After header of a response as a delay in seconds.
+
+    Args:
+        headers: Response headers (names matched case-insensitively, since
+            HTTP/2 header names are lowercase)
+
+    Returns:
+        Non-negative seconds (an int when whole, e.g. "30", a float for
+        "1.5"), or None if the header is absent or in the HTTP-date form
+    """
+    for key, value in (headers or {}).items():
+        if key.lower() == 'retry-after':
+            try:
+                seconds = float(value)
+            except (TypeError, ValueError):
+                return None  # HTTP-date form
+            if not math.isfinite(seconds):
+                return None
+            seconds = max(0.0, seconds)
+            return int(seconds) if seconds.is_integer() else seconds
+    return None
+
+
 # Helper function to create appropriate exception from response
 def create_exception_from_response(response, default_message="API request failed"):
     """
@@ -372,7 +425,8 @@ def create_exception_from_response(response, default_message="API request failed
         error_info = error_data.get('error', {})
         message = error_info.get('message', default_message)
         error_name = error_info.get('name', '')
-    except:
+    except (ValueError, AttributeError):
+        # Not JSON, or JSON that isn't a Postman error object
         error_data = None
         message = default_message
         error_name = ''
@@ -409,17 +463,9 @@ def create_exception_from_response(response, default_message="API request failed
         return ConflictError(message, status_code, error_data)
 
     elif status_code == 429:
-        # Try to get retry-after header
-        retry_after = response.headers.get('Retry-After')
-        if retry_after:
-            try:
-                retry_after = int(retry_after)
-            except:
-                retry_after = None
-
         return RateLimitError(
             message=message,
-            retry_after=retry_after,
+            retry_after=parse_retry_after(response.headers),
             status_code=status_code,
             response_data=error_data
         )
@@ -3,121 +3,186 @@ Output formatters for Postman API responses.
 Makes API data human-readable for Claude and users.
 """
 
+import sys
 from datetime import datetime
 
+# datetime.fromisoformat() accepts a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
 
-def format_collections_list(collections):
+
+def parse_timestamp(value):
     """
-    Format a list of collections into readable output.
+    Parse an ISO 8601 timestamp as returned by the API (e.g. "...T10:00:00.000Z").
+
+    Returns:
+        datetime, or None if the value is missing, 'N/A' or malformed
+    """
+    if not value or value == 'N/A':
+        return None
+    try:
+        if not _FROMISOFORMAT_ACCEPTS_Z and value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def iter_collections_list(collections):
+    """
+    Yield the lines of format_collections_list() one at a time.
 
     Args:
         collections: List of collection objects from Postman API
 
-    Returns:
-        Formatted string representation
+    Yields:
+        Output lines, without trailing newlines
     """
     if not collections:
-        return "No collections found in this workspace."
+        yield "No collections found in this workspace."
+        return
 
-    output = []
-    output.append(f"Found {len(collections)} collection(s):")
-    output.append("")
+    yield f"Found {len(collections)} collection(s):"
+    yield ""
 
     for idx, collection in enumerate(collections, 1):
         name = collection.get('name', 'Unnamed Collection')
         uid = collection.get('uid', 'N/A')
-        output.append(f"{idx}. {name}")
-        output.append(f"   UID: {uid}")
+        yield f"{idx}. {name}"
+        yield f"   UID: {uid}"
         if 'owner' in collection:
-            output.append(f"   Owner: {collection['owner']}")
-        output.append("")
-
-    return "\n".join(output)
+            yield f"   Owner: {collection['owner']}"
+        yield ""
 
 
-def format_environments_list(environments):
+def format_collections_list(collections):
     """
-    Format a list of environments into readable output.
+    Format a list of collections into readable output.
 
     Args:
-        environments: List of environment objects from Postman API
+        collections: List of collection objects from Postman API
 
     Returns:
         Formatted string representation
     """
+    return "\n".join(iter_collections_list(collections))
+
+
+def iter_environments_list(environments):
+    """
+    Yield the lines of format_environments_list() one at a time.
+
+    Args:
+        environments: List of environment objects from Postman API
+
+    Yields:
+        Output lines, without trailing newlines
+    """
     if not environments:
-        return "No environments found in this workspace."
+        yield "No environments found in this workspace."
+        return
 
-    output = []
-    output.append(f"Found {len(environments)} environment(s):")
-    output.append("")
+    yield f"Found {len(environments)} environment(s):"
+    yield ""
 
     for idx, env in enumerate(environments, 1):
         name = env.get('name', 'Unnamed Environment')
         uid = env.get('uid', 'N/A')
-        output.append(f"{idx}. {name}")
-        output.append(f"   UID: {uid}")
-        output.append("")
-
-    return "\n".join(output)
+        yield f"{idx}. {name}"
+        yield f"   UID: {uid}"
+        yield ""
 
 
-def format_monitors_list(monitors):
+def format_environments_list(environments):
     """
-    Format a list of monitors into readable output.
+    Format a list of environments into readable output.
 
     Args:
-        monitors: List of monitor objects from Postman API
+        environments: List of environment objects from Postman API
 
     Returns:
         Formatted string representation
     """
+    return "\n".join(iter_environments_list(environments))
+
+
+def iter_monitors_list(monitors):
+    """
+    Yield the lines of format_monitors_list() one at a time.
+
+    Args:
+        monitors: List of monitor objects from Postman API
+
+    Yields:
+        Output lines, without trailing newlines
+    """
     if not monitors:
-        return "No monitors found in this workspace."
+        yield "No monitors found in this workspace."
+        return
 
-    output = []
-    output.append(f"Found {len(monitors)} monitor(s):")
-    output.append("")
+    yield f"Found {len(monitors)} monitor(s):"
+    yield ""
 
     for idx, monitor in enumerate(monitors, 1):
         name = monitor.get('name', 'Unnamed Monitor')
         uid = monitor.get('uid', 'N/A')
-        output.append(f"{idx}. {name}")
-        output.append(f"   UID: {uid}")
+        yield f"{idx}. {name}"
+        yield f"   UID: {uid}"
         if 'collection' in monitor:
-            output.append(f"   Collection: {monitor['collection']}")
-        output.append("")
-
-    return "\n".join(output)
+            yield f"   Collection: {monitor['collection']}"
+        yield ""
 
 
-def format_apis_list(apis):
+def format_monitors_list(monitors):
     """
-    Format a list of APIs into readable output.
+    Format a list of monitors into readable output.
 
     Args:
-        apis: List of API objects from Postman API
+        monitors: List of monitor objects from Postman API
 
     Returns:
         Formatted string representation
     """
+    return "\n".join(iter_monitors_list(monitors))
+
+
+def iter_apis_list(apis):
+    """
+    Yield the lines of format_apis_list() one at a time.
+
+    Args:
+        apis: List of API objects from Postman API
+
+    Yields:
+        Output lines, without trailing newlines
+    """
     if not apis:
-        return "No APIs found in this workspace."
+        yield "No APIs found in this workspace."
+        return
 
-    output = []
-    output.append(f"Found {len(apis)} API(s):")
-    output.append("")
+    yield f"Found {len(apis)} API(s):"
+    yield ""
 
     for idx, api in enumerate(apis, 1):
         name = api.get('name', 'Unnamed API')
         api_id = api.get('id', 'N/A')
-        output.append(f"{idx}. {name}")
-        output.append(f"   ID: {api_id}")
+        yield f"{idx}. {name}"
+        yield f"   ID: {api_id}"
         if 'summary' in api:
-            output.append(f"   Summary: {api['summary']}")
-        output.append("")
+            yield f"   Summary: {api['summary']}"
+        yield ""
 
-    return "\n".join(output)
+
+def format_apis_list(apis):
+    """
+    Format a list of APIs into readable output.
+
+    Args:
+        apis: List of API objects from Postman API
+
+    Returns:
+        Formatted string representation
+    """
+    return "\n".join(iter_apis_list(apis))
 
 
 def format_workspace_summary(collections, environments, monitors, apis):
@@ -199,18 +264,21 @@ def format_monitor(monitor, verbose=False):
     output.append(f"   UID: {monitor.get('uid')}")
 
     if verbose:
-        if monitor.get('collectionUid'):
-            output.append(f"   Collection: {monitor.get('collectionUid')}")
-        if monitor.get('environmentUid'):
-            output.append(f"   Environment: {monitor.get('environmentUid')}")
-        if monitor.get('schedule'):
-            schedule = monitor.get('schedule', {})
+        collection_uid = monitor.get('collectionUid')
+        if collection_uid:
+            output.append(f"   Collection: {collection_uid}")
+        environment_uid = monitor.get('environmentUid')
+        if environment_uid:
+            output.append(f"   Environment: {environment_uid}")
+        schedule = monitor.get('schedule')
+        if schedule:
             output.append(f"   Schedule: {schedule.get('cron', 'Not set')}")
-        if monitor.get('lastRun'):
-            last_run = monitor.get('lastRun', {})
+        last_run = monitor.get('lastRun')
+        if last_run:
             output.append(f"   Last Run: {last_run.get('finishedAt', 'Never')}")
-            if last_run.get('status'):
-                output.append(f"   Last Status: {last_run.get('status')}")
+            last_status = last_run.get('status')
+            if last_status:
+                output.append(f"   Last Status: {last_status}")
 
     return "\n".join(output)
 
@@ -226,8 +294,6 @@ def format_monitor_run(run, index=None):
     Returns:
         Formatted string representation
     """
-    from datetime import datetime
-
     output = []
 
     status = run.get('status', 'unknown')
@@ -246,14 +312,13 @@ def format_monitor_run(run, index=None):
 
     # Calculate duration
     duration = "N/A"
-    if started != 'N/A' and finished != 'N/A':
+    start_dt = parse_timestamp(started)
+    finish_dt = parse_timestamp(finished)
+    if start_dt is not None and finish_dt is not None:
         try:
-            start_dt = datetime.fromisoformat(started.replace('Z', '+00:00'))
-            finish_dt = datetime.fromisoformat(finished.replace('Z', '+00:00'))
-            duration_seconds = (finish_dt - start_dt).total_seconds()
-            duration = f"{duration_seconds:.1f}s"
-        except:
-            pass
+            duration = f"{(finish_dt - start_dt).total_seconds():.1f}s"
+        except TypeError:
+            pass  # One timestamp has a UTC offset and the other doesn't
 
     output.append(f"   Duration: {duration}")
 
@@ -281,12 +346,20 @@ def format_monitor_runs_summary(runs):
     if not runs:
         return "No run history available."
 
-    output = []
+    # Format the runs and tally successes in the same pass
+    run_lines = []
+    successful_runs = 0
+    for i, run in enumerate(runs, 1):
+        successful_runs += run.get('status') == 'success'
+        run_lines.append(format_monitor_run(run, i))
+        run_lines.append("")
 
     # Calculate statistics
     total_runs = len(runs)
-    successful_runs = sum(1 for run in runs if run.get('status') == 'success')
     failed_runs = total_runs - successful_runs
+    percent = 100.0 / total_runs
+
+    output = []
 
     output.append(f"Monitor Run History (Last {total_runs} runs)")
     output.append("=" * 80)
@@ -295,16 +368,13 @@ def format_monitor_runs_summary(runs):
     # Summary
     output.append("Summary:")
     output.append(f"  Total Runs: {total_runs}")
-    output.append(f"  Successful: {successful_runs} ({successful_runs/total_runs*100:.1f}%)")
-    output.append(f"  Failed: {failed_runs} ({failed_runs/total_runs*100:.1f}%)")
+    output.append(f"  Successful: {successful_runs} ({successful_runs * percent:.1f}%)")
+    output.append(f"  Failed: {failed_runs} ({failed_runs * percent:.1f}%)")
     output.append("")
 
     # Recent runs
     output.append("Recent Runs:")
     output.append("-" * 80)
-
-    for i, run in enumerate(runs, 1):
-        output.append(format_monitor_run(run, i))
-        output.append("")
+    output.extend(run_lines)
 
     return "\n".join(output)
@@ -0,0 +1,81 @@
+"""
+JSON helpers that use orjson when it is installed.
+Falls back to the standard library json module with the same behavior.
+"""
+
+import json
+
+# Optional: orjson parses and serializes several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text as str or bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=None, sort_keys=False):
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with this indent (orjson is used only for 2)
+        sort_keys: Sort object keys in the output
+
+    Returns:
+        JSON text as str
+    """
+    if orjson is not None and indent in (None, 2):
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            pass  # e.g. non-str dict keys or >64-bit ints; let stdlib handle them
+    return json.dumps(obj, indent=indent, sort_keys=sort_keys)
+
+
+def dumpb(obj):
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    Used for request bodies: orjson produces bytes natively, so large
+    payloads skip a decode to str and the re-encode before sending.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # e.g. non-str dict keys or >64-bit ints; let stdlib handle them
+    return json.dumps(obj).encode('utf-8')
@@ -0,0 +1,212 @@
+"""
+Response cache for idempotent Postman API GET requests.
+Keeps raw response bodies in memory and, optionally, on disk so that
+re-running a command revalidates with a conditional GET instead of
+re-downloading unchanged responses.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+
+
+# Default on-disk location, shared by all CLI scripts
+DEFAULT_CACHE_DIR = Path(
+    os.getenv("POSTMAN_CACHE_DIR") or Path.home() / ".cache" / "postman-cli"
+)
+
+# Never written to disk: environment values and collection auth/variable
+# blocks routinely hold secrets
+MEMORY_ONLY_RESOURCES = frozenset({"environments", "collections"})
+
+# How long an expired disk entry with an ETag/Last-Modified is kept around
+# for revalidation before it is deleted (seconds)
+STALE_RETENTION = 24 * 60 * 60
+
+
+def _resource_root(endpoint):
+    """
+    Return the top-level resource of an endpoint.
+
+    "/specs/abc/files?x=1" -> "specs". Used to group entries so that a write
+    to any spec invalidates every cached spec response.
+    """
+    path = endpoint.split('?', 1)[0].strip('/')
+    return path.split('/', 1)[0] or "_root"
+
+
+class ResponseCache:
+    """
+    TTL cache of raw response bodies keyed by (scope, endpoint).
+
+    `scope` separates accounts (the client passes a digest of its API key)
+    so cached data is never served to a different key. Entries also carry
+    the response ETag and Last-Modified validators, allowing callers to
+    revalidate expired entries.
+
+    Disk persistence is best-effort: unreadable or unwritable cache files
+    behave like a miss and never fail the request. Only entries with an
+    ETag or Last-Modified validator are written, and entries loaded from
+    disk are always returned expired: another process may have changed the
+    resource since, so callers must revalidate them before use. Within a
+    process, fresh hits come from memory only. Environments and collections
+    are never persisted. Safe to share between threads.
+    """
+
+    def __init__(self, cache_dir=None, persist=None):
+        """
+        Args:
+            cache_dir: Directory for persistent entries. When None the cache
+                lives only for the lifetime of this object.
+            persist: Top-level resources (e.g. ("apis", "specs")) whose
+                responses are written to cache_dir; others stay in memory.
+                None persists everything except MEMORY_ONLY_RESOURCES.
+        """
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        self.persist = frozenset(persist) - MEMORY_ONLY_RESOURCES if persist is not None else None
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _path(self, scope, endpoint):
+        digest = hashlib.sha1(endpoint.encode('utf-8')).hexdigest()
+        return self.cache_dir / scope / _resource_root(endpoint) / f"{digest}.json"
+
+    def _persists(self, root):
+        if self.cache_dir is None or root in MEMORY_ONLY_RESOURCES:
+            return False
+        return self.persist is None or root in self.persist
+
+    def _unlink(self, scope, endpoint):
+        try:
+            self._path(scope, endpoint).unlink()
+        except OSError:
+            pass  # Missing, or removed by a concurrent reader
+
+    def get(self, scope, endpoint):
+        """
+        Look up an entry, fresh or expired.
+
+        Returns:
+            Dict with 'body', 'etag', 'last_modified' and 'expires' keys
+            ('last_modified' may be absent from older disk entries), or None
+            on a miss. Entries read from disk are always expired.
+        """
+        key = (scope, endpoint)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None or self.cache_dir is None:
+            return entry
+
+        root = _resource_root(endpoint)
+        if not self._persists(root):
+            if root in MEMORY_ONLY_RESOURCES:
+                # Written by older versions that persisted everything
+                self._unlink(scope, endpoint)
+            return None
+        try:
+            with open(self._path(scope, endpoint), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get('endpoint') != endpoint:
+            return None
+        revalidatable = entry.get('etag') or entry.get('last_modified')
+        if not revalidatable or entry['expires'] + STALE_RETENTION < time.time():
+            self._unlink(scope, endpoint)
+            return None
+        # Writes from other processes never reach this cache, so a disk entry
+        # is only trusted after a conditional GET
+        entry['expires'] = 0
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    @staticmethod
+    def is_fresh(entry):
+        """Check whether an entry returned by get() is still within its TTL."""
+        return entry is not None and entry['expires'] > time.time()
+
+    def set(self, scope, endpoint, body, ttl, etag=None, last_modified=None):
+        """
+        Store a raw response body for `ttl` seconds.
+
+        Args:
+            scope: Account scope the response belongs to
+            endpoint: API endpoint path including query string
+            body: Raw response body text
+            ttl: Time to live in seconds
+            etag: ETag header from the response, if any
+            last_modified: Last-Modified header from the response, if any
+        """
+        entry = {
+            "endpoint": endpoint,
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires": time.time() + ttl,
+        }
+        with self._lock:
+            self._entries[(scope, endpoint)] = entry
+        self._write(scope, endpoint, entry)
+
+    def refresh(self, scope, endpoint, ttl):
+        """Extend an existing entry's lifetime (e.g. after a 304 response)."""
+        entry = self.get(scope, endpoint)
+        if entry is not None:
+            entry['expires'] = time.time() + ttl
+            self._write(scope, endpoint, entry)
+
+    def invalidate(self, scope, endpoint):
+        """
+        Drop every entry under the endpoint's top-level resource.
+
+        A write to "/mocks/abc" invalidates "/mocks", "/mocks?workspace=..."
+        and every "/mocks/<id>" response.
+        """
+        root = _resource_root(endpoint)
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == scope and _resource_root(k[1]) == root]:
+                del self._entries[key]
+
+        if self.cache_dir is not None:
+            root_dir = self.cache_dir / scope / root
+            for path in root_dir.glob('*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass  # Already removed by a concurrent invalidation
+
+    def _write(self, scope, endpoint, entry):
+        if not self._persists(_resource_root(endpoint)):
+            return
+        if not (entry.get('etag') or entry.get('last_modified')):
+            return  # Could never be revalidated, so never served from disk
+        path = self._path(scope, endpoint)
+        # Per-thread temp name so concurrent writers never share a file
+        tmp_path = path.with_suffix(f'.{threading.get_ident()}.tmp')
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def cli_cache(no_cache, persist=None):
+    """
+    Build the `cache` argument for PostmanClient in a CLI script.
+
+    Args:
+        no_cache: The script's --no-cache flag
+        persist: Resources to keep on disk (see ResponseCache)
+
+    Returns:
+        A ResponseCache under DEFAULT_CACHE_DIR, or False to disable caching
+    """
+    if no_cache:
+        return False
+    return ResponseCache(DEFAULT_CACHE_DIR, persist=persist)
@@ -4,23 +4,68 @@ Retry handler with exponential backoff for Postman API calls.
 
 import time
 import sys
+import random
+import threading
+
+from utils.exceptions import create_exception_from_response, parse_retry_after
 
 
 class RetryHandler:
-    """Handles retry logic with exponential backoff for API calls"""
+    """
+    Handles retry logic with exponential backoff for API calls.
+
+    One handler is shared by all of a client's worker threads. A 429 opens
+    a pause window that every thread waits out before its next attempt, so
+    concurrent requests don't keep hitting the shared rate limit.
+    """
 
-    def __init__(self, max_retries=3, base_delay=1):
+    def __init__(self, max_retries=3, base_delay=1, max_delay=30):
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.max_delay = max_delay
+        # Capped backoff schedule, one entry per attempt
+        self._delays = tuple(
+            min(max_delay, base_delay * (1 << attempt)) for attempt in range(max_retries)
+        )
+        # time.monotonic() deadline of the current rate-limit pause
+        self._pause_until = 0.0
+        self._pause_lock = threading.Lock()
 
     def should_retry(self, status_code):
         """Determine if a request should be retried based on status code"""
         # Retry on rate limits and server errors
         return status_code in [429, 500, 502, 503, 504]
 
-    def get_delay(self, attempt):
-        """Calculate exponential backoff delay"""
-        return self.base_delay * (2 ** attempt)
+    def get_delay(self, attempt, retry_after=None):
+        """
+        Calculate a capped, jittered exponential backoff delay.
+
+        Jitter spreads out clients that failed at the same moment so they
+        don't retry in lockstep. A server-provided Retry-After is used as a
+        lower bound.
+        """
+        delay = self._delays[attempt] * random.uniform(0.5, 1.0)
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def get_retry_after(response):
+        """Return the Retry-After header in seconds, or None if absent/not numeric"""
+        # Same parser as RateLimitError.retry_after, so both agree
+        return parse_retry_after(getattr(response, 'headers', None))
+
+    def _pause(self, delay):
+        """Hold back every caller of this handler for `delay` seconds"""
+        until = time.monotonic() + delay
+        with self._pause_lock:
+            if until > self._pause_until:
+                self._pause_until = until
+
+    def _wait_for_pause(self):
+        remaining = self._pause_until - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
     def execute(self, func, *args, **kwargs):
         """
@@ -34,30 +79,34 @@ class RetryHandler:
             Response object from successful request
 
         Raises:
-            Exception: If all retries are exhausted
+            PostmanAPIError: Subclass matching the last response's status code
+                if all retries are exhausted on a retryable status
+            Exception: Whatever func raised on its final attempt
         """
         last_exception = None
 
         for attempt in range(self.max_retries):
             try:
+                self._wait_for_pause()
                 response = func(*args, **kwargs)
 
                 # Check if we should retry
                 if self.should_retry(response.status_code):
                     if attempt < self.max_retries - 1:
-                        delay = self.get_delay(attempt)
+                        delay = self.get_delay(attempt, self.get_retry_after(response))
                         print(
                             f"Rate limited or server error (status {response.status_code}). "
-                            f"Retrying in {delay}s... (attempt {attempt + 1}/{self.max_retries})",
+                            f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/{self.max_retries})",
                             file=sys.stderr
                         )
+                        if response.status_code == 429:
+                            # Rate limits are per account: pause the other threads too
+                            self._pause(delay)
                         time.sleep(delay)
                         continue
                     else:
-                        raise Exception(
-                            f"Max retries ({self.max_retries}) exceeded. "
-                            f"Last status code: {response.status_code}"
-                        )
+                        # Surface the API's own error (RateLimitError, ServerError, ...)
+                        raise create_exception_from_response(response)
 
                 # Success or non-retryable error
                 return response
@@ -68,7 +117,7 @@ class RetryHandler:
                     delay = self.get_delay(attempt)
                     print(
                         f"Request failed: {e}. "
-                        f"Retrying in {delay}s... (attempt {attempt + 1}/{self.max_retries})",
+                        f"Retrying in {delay:.1f}s... (attempt {attempt + 1}/{self.max_retries})",
                         file=sys.stderr
                     )
                     time.sleep(delay)